@@ -39,13 +39,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from flask import Flask, Response, g, jsonify, request, send_file
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 
 # Import middleware
 from middleware import (
     ErrorHandler,
     RateLimiterConfig,
     ValidationError,
+    get_api_log_handler,
     setup_rate_limiter,
     validate_crowd_noise,
     validate_formation,
@@ -76,6 +77,13 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from data.generators.synthetic_dataset import SyntheticDatasetGenerator
 from jobs.streaming import StreamingJobManager, run_streaming_sweep
 from ml.policy_trainer import (
@@ -114,19 +122,17 @@ app = Flask(__name__)
 # Ensure logs directory exists
 os.makedirs("backend/logs", exist_ok=True)
 
-# Configure basic logging (file + console) for hardening and diagnostics
-log_file = "backend/logs/api.log"
+# Configure basic logging (file + console) for hardening and diagnostics.
+# The file side goes through the shared queued, rotating api.log handler.
 logger = logging.getLogger("simulation_api")
 logger.setLevel(logging.INFO)
 if not logger.handlers:
-    fh = logging.FileHandler(log_file)
-    fh.setLevel(logging.INFO)
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
-    fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
-    fh.setFormatter(fmt)
-    ch.setFormatter(fmt)
-    logger.addHandler(fh)
+    ch.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    logger.addHandler(get_api_log_handler())
     logger.addHandler(ch)
 
 # Mirror logger handlers to Flask app logger
@@ -137,11 +143,28 @@ app.logger.setLevel(logging.INFO)
 error_handler = ErrorHandler(app)
 
 # Initialize rate limiter
-limiter = setup_rate_limiter(app, storage_uri="memory://")
+limiter = setup_rate_limiter(app)
+
+
+class OrjsonSocketJSON:
+    """json-module stand-in so Socket.IO packets are (de)serialized by orjson."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
 
 # Initialize SocketIO for streaming
 socketio = SocketIO(
-    app, cors_allowed_origins=["http://localhost:5173", "http://127.0.0.1:5173"]
+    app,
+    cors_allowed_origins=["http://localhost:5173", "http://127.0.0.1:5173"],
+    **({"json": OrjsonSocketJSON} if ORJSON_AVAILABLE else {}),
 )
 job_manager = StreamingJobManager()
 
@@ -531,7 +554,7 @@ def simulate():
     Response — aggregated MC statistics including:
       avgPMU, goalProbability, xg, playerMomentum (top 10), outcomeDistribution, etc.
     """
-    body = request.validated_data
+    body = g.validated_data
 
     try:
         # Validate inputs
@@ -610,7 +633,7 @@ def sweep_scenarios():
     Response:
       Ranked list of all 16 formation/tactic combinations with deltas from baseline (4-3-3 + balanced)
     """
-    body = request.validated_data
+    body = g.validated_data
 
     try:
         # Validate inputs
@@ -829,11 +852,11 @@ def sweep_scenarios_stream():
       }
 
     Events emitted:
-      sweep_progress — {combo_index, total_combos, current_combo, metrics, progress_percent}
+      sweep_progress_batch — [{combo_index, total_combos, current_combo, metrics, ...}]
       sweep_complete — {ranked_scenarios, top_3_recommendations}
       sweep_error — {error message}
     """
-    body = request.validated_data
+    body = g.validated_data
 
     try:
         # Validate inputs
@@ -893,6 +916,7 @@ def sweep_scenarios_stream():
             rank_by,
             lambda cfg: MonteCarloEngine(cfg).run(),
             compute_analytical_layers,
+            job_manager,
         ),
         daemon=True,
     )
@@ -1025,7 +1049,7 @@ def get_ml_recommendations():
         if not policy_trainer.policy.trained:
             return error("Policy not trained. Call /api/ml/train first.", 400)
 
-        body = request.validated_data
+        body = g.validated_data
         game_state_data = body.get("game_state", {})
 
         # Construct TrainingState from request
@@ -1152,7 +1176,7 @@ def get_coach_recommendations():
             get_coach_tactical_profile,
         )
 
-        body = request.validated_data
+        body = g.validated_data
         game_state = body.get("game_state", {})
 
         recommendations = get_coach_recommendations_for_state(
@@ -1212,7 +1236,7 @@ def save_scenario():
         "tags": ["aggressive", "formation-test", "high-risk"]
       }
     """
-    body = request.validated_data
+    body = g.validated_data
 
     try:
         # Validate inputs
@@ -2717,7 +2741,7 @@ def calibrate():
     Returns:
       Full validation report with metrics and recommendations
     """
-    body = request.validated_data
+    body = g.validated_data
 
     try:
         num_matches = int(body.get("num_matches", 100))
@@ -3368,12 +3392,44 @@ def handle_disconnect():
 
 @socketio.on("subscribe_job")
 def handle_subscribe_job(data):
-    """Subscribe to updates for a specific job."""
+    """Subscribe to updates for a specific job by joining its room."""
     job_id = data.get("job_id")
     if job_id:
+        join_room(job_id)
         print(f"Client {request.sid} subscribed to job {job_id}")
         emit("subscription_confirmed", {"job_id": job_id})
 
+        # Job may have finished before the client subscribed: replay outcome
+        status = job_manager.get_job_status(job_id)
+        if status and status["status"] == "completed":
+            emit(
+                "sweep_complete",
+                {
+                    "job_id": job_id,
+                    "result": status["data"]["result"],
+                    "timestamp": time.time(),
+                },
+            )
+        elif status and status["status"] == "error":
+            emit(
+                "sweep_error",
+                {
+                    "job_id": job_id,
+                    "error": status["data"]["error"],
+                    "timestamp": time.time(),
+                },
+            )
+
+
+@socketio.on("unsubscribe_job")
+def handle_unsubscribe_job(data):
+    """Stop receiving updates for a job by leaving its room."""
+    job_id = data.get("job_id")
+    if job_id:
+        leave_room(job_id)
+        print(f"Client {request.sid} unsubscribed from job {job_id}")
+        emit("unsubscription_confirmed", {"job_id": job_id})
+
 
 @socketio.on("subscribe_ml_training")
 def handle_subscribe_ml_training():
@@ -1,16 +1,5 @@
 """Coaching intelligence module — integrates elite coach tactics into AI"""
 
-from .coaching_knowledge import (
-    ELITE_COACHES,
-    CoachProfile,
-    get_all_coaches,
-    get_coach_recommendations_for_state,
-    get_coach_tactical_profile,
-    get_coaches_by_style,
-    get_formation_by_coach,
-    get_training_emphasis,
-)
-
 __all__ = [
     "CoachProfile",
     "ELITE_COACHES",
@@ -21,3 +10,13 @@ __all__ = [
     "get_all_coaches",
     "get_coaches_by_style",
 ]
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: coaching_knowledge (and the coach table) is only
+    # imported the first time one of its names is accessed.
+    if name in __all__:
+        from . import coaching_knowledge
+
+        return getattr(coaching_knowledge, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,10 +12,13 @@ This module provides:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class CoachProfile:
     """Elite coach profile with tactical DNA"""
 
@@ -42,7 +45,7 @@ class CoachProfile:
 
 
 # Top 20 Coaches (2016-2026)
-ELITE_COACHES: List[CoachProfile] = [
+ELITE_COACHES: Tuple[CoachProfile, ...] = (
     CoachProfile(
         name="Carlo Ancelotti",
         nationality="Italian",
@@ -483,7 +486,34 @@ ELITE_COACHES: List[CoachProfile] = [
         tactical_emphasis=0.80,
         mental_emphasis=0.75,
     ),
-]
+)
+
+
+# Scoring axes as a column array (one row per coach), built once at import.
+# Columns: possession_preference, pressing_intensity, transition_speed
+# Stored as int8 percentages; profile values are whole percentages, so
+# dividing by 100.0 recovers the exact original floats for scoring.
+_COACH_NAMES: Tuple[str, ...] = tuple(c.name for c in ELITE_COACHES)
+_COACH_Q = np.array(
+    [
+        (
+            round(c.possession_preference * 100),
+            round(c.pressing_intensity * 100),
+            round(c.transition_speed * 100),
+        )
+        for c in ELITE_COACHES
+    ],
+    dtype=np.int8,
+)
+_COACH_ARR = _COACH_Q / 100.0
+_POSS = _COACH_ARR[:, 0]
+_PRESS = _COACH_ARR[:, 1]
+_TRANS = _COACH_ARR[:, 2]
+
+# Loop-invariant terms of the recommendation score
+_INV_PRESS = 1.0 - _PRESS
+_INV_TRANS = 1.0 - _TRANS
+_BALANCE = 1.0 - np.abs(_POSS - 0.5) * 2.0
 
 
 def get_coach_recommendations_for_state(
@@ -496,46 +526,33 @@ def get_coach_recommendations_for_state(
     Get top coach recommendations based on game state.
     Returns: [(coach_name, recommendation_score), ...]
     """
-    recommendations = []
-
-    for coach in ELITE_COACHES:
-        score = 0.0
-
-        # Score based on possession preference vs. current possession
-        possession_match = 1.0 - abs(coach.possession_preference - (possession / 100.0))
-        score += possession_match * 0.25
-
-        # Score based on pressing intensity vs. current situation
-        if momentum > 0:  # Winning, can press more
-            pressing_match = coach.pressing_intensity
-            score += pressing_match * 0.20
-        else:  # Losing, might need conservative approach
-            pressing_match = 1.0 - coach.pressing_intensity
-            score += pressing_match * 0.20
-
-        # Score based on fatigue management
-        if fatigue > 70:  # Players tired, need structured approach
-            structure_emphasis = 1.0 - coach.transition_speed
-            score += structure_emphasis * 0.15
-        else:
-            score += coach.transition_speed * 0.15
-
-        # Score based on tactical style for given situation
-        if score_differential > 0:  # Winning
-            # Prefer coaches known for controlling games
-            score += coach.possession_preference * 0.20
-        elif score_differential < 0:  # Losing
-            # Prefer coaches known for transitional play
-            score += coach.transition_speed * 0.20
-        else:  # Tied
-            # Prefer balanced coaches
-            balance = 1.0 - abs(coach.possession_preference - 0.5) * 2
-            score += balance * 0.20
-
-        # Normalize to 0-1
-        score = min(1.0, score / 1.0)
-
-        recommendations.append((coach.name, score))
+    poss_frac = possession / 100.0
+
+    # Score based on possession preference vs. current possession
+    scores = (1.0 - np.abs(_POSS - poss_frac)) * 0.25
+
+    # Score based on pressing intensity vs. current situation
+    # Winning can press more; losing might need a conservative approach
+    scores += (_PRESS if momentum > 0 else _INV_PRESS) * 0.20
+
+    # Score based on fatigue management (tired players need structure)
+    scores += (_INV_TRANS if fatigue > 70 else _TRANS) * 0.15
+
+    # Score based on tactical style for given situation
+    if score_differential > 0:  # Winning
+        # Prefer coaches known for controlling games
+        scores += _POSS * 0.20
+    elif score_differential < 0:  # Losing
+        # Prefer coaches known for transitional play
+        scores += _TRANS * 0.20
+    else:  # Tied
+        # Prefer balanced coaches
+        scores += _BALANCE * 0.20
+
+    # Normalize to 0-1
+    np.minimum(scores, 1.0, out=scores)
+
+    recommendations = list(zip(_COACH_NAMES, scores.tolist()))
 
     # Sort by score (descending)
     recommendations.sort(key=lambda x: x[1], reverse=True)
@@ -543,12 +560,13 @@ def get_coach_recommendations_for_state(
     return recommendations
 
 
+# Case-insensitive name lookup table
+_BY_NAME: Dict[str, CoachProfile] = {c.name.lower(): c for c in ELITE_COACHES}
+
+
 def get_coach_tactical_profile(coach_name: str) -> Optional[CoachProfile]:
     """Get full profile for a specific coach"""
-    for coach in ELITE_COACHES:
-        if coach.name.lower() == coach_name.lower():
-            return coach
-    return None
+    return _BY_NAME.get(coach_name.lower())
 
 
 def get_formation_by_coach(coach_name: str) -> Optional[str]:
@@ -571,13 +589,29 @@ def get_training_emphasis(coach_name: str) -> Optional[Dict[str, float]]:
     }
 
 
-def get_all_coaches() -> List[CoachProfile]:
-    """Get all elite coaches"""
+def get_all_coaches() -> Tuple[CoachProfile, ...]:
+    """Get all elite coaches (shared immutable tuple, not a copy)"""
     return ELITE_COACHES
 
 
-def get_coaches_by_style(tactical_style: str) -> List[CoachProfile]:
-    """Filter coaches by tactical style"""
-    return [
-        c for c in ELITE_COACHES if tactical_style.lower() in c.tactical_style.lower()
-    ]
+# Style filter results for every known tactical_style, built once at import.
+# Each entry holds the same substring matches a full scan would return.
+_STYLE_INDEX: Dict[str, Tuple[CoachProfile, ...]] = {
+    style: tuple(c for c in ELITE_COACHES if style in c.tactical_style.lower())
+    for style in dict.fromkeys(c.tactical_style.lower() for c in ELITE_COACHES)
+}
+
+
+@lru_cache(maxsize=128)
+def _match_style_substring(style: str) -> Tuple[CoachProfile, ...]:
+    """Substring scan for partial style queries (e.g. "pressing")"""
+    return tuple(c for c in ELITE_COACHES if style in c.tactical_style.lower())
+
+
+def get_coaches_by_style(tactical_style: str) -> Tuple[CoachProfile, ...]:
+    """Filter coaches by tactical style (substring match, case-insensitive)"""
+    style = tactical_style.lower()
+    coaches = _STYLE_INDEX.get(style)
+    if coaches is None:
+        coaches = _match_style_substring(style)
+    return coaches
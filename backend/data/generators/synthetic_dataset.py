@@ -6,7 +6,15 @@ Generate synthetic match datasets for validation testing
 import json
 import random
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 
 class SyntheticDatasetGenerator:
@@ -32,9 +40,27 @@ class SyntheticDatasetGenerator:
         "Bournemouth",
     ]
 
+    # Per-tactic (possession_lo, possession_hi, tackles_lo, tackles_hi) ranges
+    _TACTIC_PARAMS = {
+        "aggressive": (45, 55, 10, 20),
+        "balanced": (45, 55, 12, 22),
+        "defensive": (35, 50, 20, 35),
+        "possession": (55, 70, 12, 22),
+    }
+    _DEFAULT_TACTIC_PARAMS = (45, 55, 12, 22)
+
+    # Every possible match date (12 months x 28 days), formatted once
+    _DATE_STRINGS = tuple(
+        f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)
+    )
+
+    # Fixed decimal places applied only when a dataset is written to disk
+    OUTPUT_PRECISION = {"xg_a": 3, "xg_b": 3, "possession_a": 1, "possession_b": 1}
+
     def __init__(self, seed: int = 42):
         """Initialize generator with optional seed for reproducibility."""
-        random.seed(seed)
+        # Per-instance RNG: no shared global state between generators
+        self._rng = random.Random(seed)
 
     @staticmethod
     def _formation_to_coherence(formation: str) -> float:
@@ -59,8 +85,7 @@ class SyntheticDatasetGenerator:
         }
         return multiplier_map.get(tactic, 1.0)
 
-    @classmethod
-    def generate_match(cls, match_id: int) -> Dict:
+    def generate_match(self, match_id: int) -> Dict:
         """
         Generate a single synthetic match.
 
@@ -68,22 +93,43 @@ class SyntheticDatasetGenerator:
             Dictionary with: match_id, date, team_a, team_b, formation_a, formation_b,
                            tactic_a, tactic_b, goals_a, goals_b, xg_a, xg_b, etc.
         """
-        # Random team selection
-        teams = random.sample(cls.TEAM_NAMES, 2)
-        team_a, team_b = teams[0], teams[1]
+        rng = self._rng
+        return self._generate_match_from_presampled(
+            match_id,
+            rng.choice(self.FORMATIONS),
+            rng.choice(self.FORMATIONS),
+            rng.choice(self.TACTICS),
+            rng.choice(self.TACTICS),
+            rng.random(),
+            rng.random(),
+        )
+
+    def _generate_match_from_presampled(
+        self,
+        match_id: int,
+        formation_a: str,
+        formation_b: str,
+        tactic_a: str,
+        tactic_b: str,
+        noise_a: float,
+        noise_b: float,
+    ) -> Dict:
+        """
+        Build a match from pre-drawn setup choices.
 
-        # Random formations and tactics
-        formation_a = random.choice(cls.FORMATIONS)
-        formation_b = random.choice(cls.FORMATIONS)
-        tactic_a = random.choice(cls.TACTICS)
-        tactic_b = random.choice(cls.TACTICS)
+        noise_a/noise_b are uniform [0, 1) samples scaled to the ±20% xG noise.
+        """
+        rng = self._rng
+
+        # Random team selection
+        team_a, team_b = rng.sample(self.TEAM_NAMES, 2)
 
         # Calculate base xG from formations and tactics
-        coherence_a = cls._formation_to_coherence(formation_a)
-        coherence_b = cls._formation_to_coherence(formation_b)
+        coherence_a = self._formation_to_coherence(formation_a)
+        coherence_b = self._formation_to_coherence(formation_b)
 
-        tactic_mult_a = cls._tactic_to_xg_multiplier(tactic_a)
-        tactic_mult_b = cls._tactic_to_xg_multiplier(tactic_b)
+        tactic_mult_a = self._tactic_to_xg_multiplier(tactic_a)
+        tactic_mult_b = self._tactic_to_xg_multiplier(tactic_b)
 
         base_xg = 0.035  # League average
 
@@ -94,58 +140,48 @@ class SyntheticDatasetGenerator:
         xg_b_raw = base_xg * tactic_mult_b * coherence_b * (1.0 - coherence_a * 0.1)
 
         # Add random noise (±20%)
-        xg_a = xg_a_raw * random.uniform(0.8, 1.2)
-        xg_b = xg_b_raw * random.uniform(0.8, 1.2)
+        xg_a = xg_a_raw * (0.8 + 0.4 * noise_a)
+        xg_b = xg_b_raw * (0.8 + 0.4 * noise_b)
 
         # Convert xG to goal probability (nonlinear: higher xG = slightly diminishing returns)
         goal_prob_a = 1.0 - pow(0.98, xg_a * 100)  # Sigmoid-like
         goal_prob_b = 1.0 - pow(0.98, xg_b * 100)
 
         # Generate goals using probabilities
-        goals_a = 1 if random.random() < goal_prob_a else 0
+        goals_a = 1 if rng.random() < goal_prob_a else 0
         goals_a += (
-            1 if random.random() < (goal_prob_a * 0.3) else 0
+            1 if rng.random() < (goal_prob_a * 0.3) else 0
         )  # 30% chance of 2nd goal
 
-        goals_b = 1 if random.random() < goal_prob_b else 0
-        goals_b += 1 if random.random() < (goal_prob_b * 0.3) else 0
+        goals_b = 1 if rng.random() < goal_prob_b else 0
+        goals_b += 1 if rng.random() < (goal_prob_b * 0.3) else 0
 
-        # Possession (based on tactics)
-        if tactic_a == "possession":
-            possession_a = random.uniform(55, 70)
-        elif tactic_a == "defensive":
-            possession_a = random.uniform(35, 50)
-        else:
-            possession_a = random.uniform(45, 55)
+        # Possession and tackle ranges (based on tactics)
+        poss_lo, poss_hi, tackles_lo_a, tackles_hi_a = self._TACTIC_PARAMS.get(
+            tactic_a, self._DEFAULT_TACTIC_PARAMS
+        )
+        tackles_lo_b, tackles_hi_b = self._TACTIC_PARAMS.get(
+            tactic_b, self._DEFAULT_TACTIC_PARAMS
+        )[2:]
 
+        possession_a = rng.uniform(poss_lo, poss_hi)
         possession_b = 100.0 - possession_a
 
         # Shots (rough estimate: ~3-5 shots per 0.01 xG)
-        shots_a = max(1, int(xg_a * 300) + random.randint(-2, 2))
-        shots_b = max(1, int(xg_b * 300) + random.randint(-2, 2))
+        shots_a = max(1, int(xg_a * 300) + rng.randint(-2, 2))
+        shots_b = max(1, int(xg_b * 300) + rng.randint(-2, 2))
 
         # Tackles/pressure (more with defensive tactic)
-        if tactic_a == "aggressive":
-            tackles_a = random.randint(10, 20)
-        elif tactic_a == "defensive":
-            tackles_a = random.randint(20, 35)
-        else:
-            tackles_a = random.randint(12, 22)
-
-        if tactic_b == "aggressive":
-            tackles_b = random.randint(10, 20)
-        elif tactic_b == "defensive":
-            tackles_b = random.randint(20, 35)
-        else:
-            tackles_b = random.randint(12, 22)
+        tackles_a = rng.randint(tackles_lo_a, tackles_hi_a)
+        tackles_b = rng.randint(tackles_lo_b, tackles_hi_b)
 
         # Passes (possession-based)
-        total_passes_a = int(possession_a * 10 + random.randint(-20, 20))
-        total_passes_b = int(possession_b * 10 + random.randint(-20, 20))
+        total_passes_a = int(possession_a * 10 + rng.randint(-20, 20))
+        total_passes_b = int(possession_b * 10 + rng.randint(-20, 20))
 
         return {
             "match_id": str(match_id),
-            "date": f"2025-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
+            "date": self._DATE_STRINGS[rng.randrange(len(self._DATE_STRINGS))],
             "team_a": team_a,
             "team_b": team_b,
             "formation_a": formation_a,
@@ -154,52 +190,134 @@ class SyntheticDatasetGenerator:
             "tactic_b": tactic_b,
             "goals_a": goals_a,
             "goals_b": goals_b,
-            "xg_a": round(xg_a, 3),
-            "xg_b": round(xg_b, 3),
+            "xg_a": xg_a,
+            "xg_b": xg_b,
             "shot_count_a": shots_a,
             "shot_count_b": shots_b,
             "tackles_a": tackles_a,
             "tackles_b": tackles_b,
             "passes_a": total_passes_a,
             "passes_b": total_passes_b,
-            "possession_a": round(possession_a, 1),
-            "possession_b": round(possession_b, 1),
+            "possession_a": possession_a,
+            "possession_b": possession_b,
         }
 
-    @classmethod
-    def generate_dataset(cls, num_matches: int = 100, seed: int = 42) -> List[Dict]:
+    def iter_dataset(
+        self, num_matches: int = 100, seed: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily yield synthetic matches one at a time.
+
+        Same sequence as generate_dataset() for the same seed, but only one
+        match dict is alive at a time.
+        """
+        rng = self._rng
+        if seed is not None:
+            rng.seed(seed)
+
+        # Draw every per-match setup choice up front in batched calls
+        formations_a = rng.choices(self.FORMATIONS, k=num_matches)
+        formations_b = rng.choices(self.FORMATIONS, k=num_matches)
+        tactics_a = rng.choices(self.TACTICS, k=num_matches)
+        tactics_b = rng.choices(self.TACTICS, k=num_matches)
+        noise = [rng.random() for _ in range(2 * num_matches)]
+
+        for i in range(num_matches):
+            yield self._generate_match_from_presampled(
+                i + 1,
+                formations_a[i],
+                formations_b[i],
+                tactics_a[i],
+                tactics_b[i],
+                noise[2 * i],
+                noise[2 * i + 1],
+            )
+
+    def generate_dataset(
+        self, num_matches: int = 100, seed: Optional[int] = None
+    ) -> List[Dict]:
         """
         Generate a dataset of synthetic matches.
 
         Args:
             num_matches: Number of matches to generate (default: 100)
-            seed: Random seed for reproducibility
+            seed: Optional reseed for reproducibility (default: keep the
+                  generator's own seed)
 
         Returns:
             List of match dictionaries
         """
-        random.seed(seed)
-        matches = []
-
-        for i in range(num_matches):
-            match = cls.generate_match(match_id=i + 1)
-            matches.append(match)
-
-        return matches
+        return list(self.iter_dataset(num_matches, seed))
 
     @staticmethod
     def save_dataset(
-        matches: List[Dict], output_path: str = "backend/data/synthetic_matches.json"
+        matches: Iterable[Dict],
+        output_path: str = "backend/data/synthetic_matches.json",
     ):
-        """Save dataset to JSON file."""
+        """
+        Save dataset to a JSON array file.
+
+        A ``.jsonl`` output_path is written as JSON Lines instead.
+        """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(matches, f, indent=2)
+        if Path(output_path).suffix == ".jsonl":
+            count = SyntheticDatasetGenerator._write_jsonl(matches, output_path)
+        else:
+            rows = [SyntheticDatasetGenerator._round_for_output(m) for m in matches]
+            with open(output_path, "w") as f:
+                json.dump(rows, f, indent=2)
+            count = len(rows)
 
-        print(f"✓ Saved {len(matches)} synthetic matches to {output_path}")
+        print(f"✓ Saved {count} synthetic matches to {output_path}")
         return output_path
 
+    def save_dataset_jsonl(
+        self,
+        num_matches: int,
+        output_path: str = "backend/data/synthetic_matches.jsonl",
+        seed: Optional[int] = None,
+    ):
+        """
+        Generate matches and stream them to disk as JSON Lines.
+
+        Peak memory stays constant in num_matches: each match is written as
+        soon as it is generated and never buffered in a list.
+        """
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        count = self._write_jsonl(self.iter_dataset(num_matches, seed), output_path)
+
+        print(f"✓ Streamed {count} synthetic matches to {output_path}")
+        return output_path
+
+    @classmethod
+    def _round_for_output(cls, match: Dict) -> Dict:
+        """Copy of a match with float fields rounded to OUTPUT_PRECISION."""
+        rounded = dict(match)
+        for key, digits in cls.OUTPUT_PRECISION.items():
+            if key in rounded:
+                rounded[key] = round(rounded[key], digits)
+        return rounded
+
+    @staticmethod
+    def _write_jsonl(matches: Iterable[Dict], output_path: str) -> int:
+        """Write one JSON object per line; returns the number of rows."""
+        round_row = SyntheticDatasetGenerator._round_for_output
+        count = 0
+        if ORJSON_AVAILABLE:
+            with open(output_path, "wb") as f:
+                for match in matches:
+                    f.write(orjson.dumps(round_row(match)))
+                    f.write(b"\n")
+                    count += 1
+        else:
+            with open(output_path, "w") as f:
+                for match in matches:
+                    f.write(json.dumps(round_row(match)))
+                    f.write("\n")
+                    count += 1
+        return count
+
 
 if __name__ == "__main__":
     # Generate sample dataset
@@ -4,8 +4,143 @@ Load and parse StatsBomb match data for model calibration
 """
 
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# Files at least this large are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+# Integer codes for the event types that feed match stats
+SHOT, PASS, TACKLE = 1, 2, 3
+_EVENT_TYPE_CODES = {"Shot": SHOT, "Pass": PASS, "Tackle": TACKLE}
+
+# Per-match event columns: (type code, team code, xG, is-goal)
+EventArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Shared stand-in for a missing nested object; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
+def _read_json(file_path) -> Any:
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    if not ORJSON_AVAILABLE:
+        with open(file_path, "r") as f:
+            return json.load(f)
+
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _aggregate_event_arrays(
+    types: np.ndarray,
+    teams: np.ndarray,
+    xgs: np.ndarray,
+    goals: np.ndarray,
+    home_code: int,
+    away_code: int,
+) -> Tuple[int, int, float, float, int, int, int, int, int, int]:
+    """
+    Reduce one match's event columns to
+    (goals_a, goals_b, xg_a, xg_b, passes_a, passes_b, tackles_a, tackles_b,
+    shots_a, shots_b).
+
+    Goals/xG credit any non-home team to Team B; counts need an exact team.
+    """
+    is_home = teams == home_code
+    is_away = teams == away_code
+    is_shot = types == SHOT
+    is_pass = types == PASS
+    is_tackle = types == TACKLE
+
+    home_shots = is_shot & is_home
+    other_shots = is_shot & ~is_home
+
+    return (
+        int(np.count_nonzero(home_shots & goals)),
+        int(np.count_nonzero(other_shots & goals)),
+        float(xgs[home_shots].sum()),
+        float(xgs[other_shots].sum()),
+        int(np.count_nonzero(is_pass & is_home)),
+        int(np.count_nonzero(is_pass & is_away)),
+        int(np.count_nonzero(is_tackle & is_home)),
+        int(np.count_nonzero(is_tackle & is_away)),
+        int(np.count_nonzero(home_shots)),
+        int(np.count_nonzero(is_shot & is_away)),
+    )
+
+
+def _aggregate_grouped_event_arrays(
+    columns: List[EventArrays], team_codes: List[Tuple[int, int]]
+) -> List[Tuple[int, int, float, float, int, int, int, int, int, int]]:
+    """
+    Grouped version of _aggregate_event_arrays over many matches at once.
+
+    Concatenates every match's columns and reduces per match with
+    np.bincount; xG sums accumulate in event order like a sequential loop.
+    """
+    n = len(columns)
+    match_idx = np.repeat(np.arange(n), [len(c[0]) for c in columns])
+    types = np.concatenate([c[0] for c in columns])
+    teams = np.concatenate([c[1] for c in columns])
+    xgs = np.concatenate([c[2] for c in columns])
+    goals = np.concatenate([c[3] for c in columns])
+
+    codes = np.array(team_codes, dtype=np.int64).reshape(n, 2)
+    is_home = teams == codes[match_idx, 0]
+    is_away = teams == codes[match_idx, 1]
+    is_shot = types == SHOT
+    is_pass = types == PASS
+    is_tackle = types == TACKLE
+
+    home_shots = is_shot & is_home
+    other_shots = is_shot & ~is_home
+
+    def count(mask: np.ndarray) -> List[int]:
+        return np.bincount(match_idx[mask], minlength=n).tolist()
+
+    def total(mask: np.ndarray) -> List[float]:
+        # astype: bincount returns int64 when no element is selected
+        sums = np.bincount(match_idx[mask], weights=xgs[mask], minlength=n)
+        return sums.astype(np.float64).tolist()
+
+    return list(
+        zip(
+            count(home_shots & goals),
+            count(other_shots & goals),
+            total(home_shots),
+            total(other_shots),
+            count(is_pass & is_home),
+            count(is_pass & is_away),
+            count(is_tackle & is_home),
+            count(is_tackle & is_away),
+            count(home_shots),
+            count(is_shot & is_away),
+        )
+    )
 
 
 class StatsBombLoader:
@@ -23,6 +158,9 @@ class StatsBombLoader:
         self.data_dir = Path(data_dir)
         self.matches = []
         self.events = {}
+        self.event_arrays: Dict[Any, EventArrays] = {}
+        # Dense integer code per team id seen in events (None included)
+        self._team_codes: Dict[Any, int] = {}
 
     def load_matches(self, file_path: Optional[str] = None) -> List[Dict]:
         """
@@ -41,17 +179,21 @@ class StatsBombLoader:
             print(f"Warning: {file_path} not found, returning empty list")
             return []
 
-        with open(file_path, "r") as f:
-            self.matches = json.load(f)
+        self.matches = _read_json(file_path)
 
         return self.matches
 
-    def load_events(self, file_path: Optional[str] = None) -> Dict:
+    def load_events(
+        self, file_path: Optional[str] = None, streaming: bool = False
+    ) -> Dict:
         """
         Load events from JSON file.
 
         Args:
             file_path: Path to events.json
+            streaming: Parse incrementally with ijson instead of reading the
+                       whole file and decoded array up front (for very large
+                       dumps; slower than the default parser on small files)
 
         Returns:
             Dictionary mapping match_id -> list of events
@@ -63,115 +205,108 @@ class StatsBombLoader:
             print(f"Warning: {file_path} not found, returning empty dict")
             return {}
 
-        with open(file_path, "r") as f:
-            events_data = json.load(f)
+        if streaming and not IJSON_AVAILABLE:
+            print("Warning: ijson not installed, loading events without streaming")
+            streaming = False
 
-        # Index events by match_id
-        self.events = {}
-        for event in events_data:
-            match_id = event.get("match_id", "unknown")
-            if match_id not in self.events:
-                self.events[match_id] = []
-            self.events[match_id].append(event)
+        if streaming:
+            with open(file_path, "rb") as f:
+                self._index_events(ijson.items(f, "item", use_float=True))
+        else:
+            self._index_events(_read_json(file_path))
 
         return self.events
 
-    def extract_match_stats(self, match: Dict) -> Dict:
-        """
-        Extract key statistics from a match.
+    def _index_events(self, events_data) -> None:
+        """Group an iterable of events into self.events by match_id."""
+        self.events = {}
+        index = self.events.setdefault
+        for event in events_data:
+            index(event.get("match_id", "unknown"), []).append(event)
 
-        Args:
-            match: Match dictionary from StatsBomb
+        self.event_arrays = {
+            match_id: self._build_event_arrays(events)
+            for match_id, events in self.events.items()
+        }
 
-        Returns:
-            Dictionary with: match_id, date, team_a, team_b, goals_a, goals_b, xg_a, xg_b, etc.
+    def _build_event_arrays(self, events: List[Dict]) -> EventArrays:
         """
-        match_id = match.get("match_id")
-        events = self.events.get(match_id, [])
-
-        # Extract teams
-        home_team = match.get("home_team", {})
-        away_team = match.get("away_team", {})
-
-        team_a_name = home_team.get("home_team_name", "Team A")
-        team_b_name = away_team.get("away_team_name", "Team B")
+        Flatten the stat-relevant events of one match into column arrays.
 
-        # Count goals from events
-        goals_a = 0
-        goals_b = 0
+        Only Shot/Pass/Tackle events are kept; team ids are mapped to dense
+        integer codes so any hashable id (including a missing one) compares
+        the same way it did as a dict value.
+        """
+        team_codes = self._team_codes
+        types, teams, xgs, goals = [], [], [], []
 
         for event in events:
-            if event.get("type") == "Shot":
-                outcome = event.get("shot", {}).get("outcome", {})
-                if outcome.get("name") == "Goal":
-                    team = event.get("team", {}).get("id")
-                    if team == home_team.get("home_team_id"):
-                        goals_a += 1
-                    else:
-                        goals_b += 1
-
-        # Calculate xG from shots
-        xg_a = 0.0
-        xg_b = 0.0
+            type_code = _EVENT_TYPE_CODES.get(event.get("type"))
+            if type_code is None:
+                continue
 
-        for event in events:
-            if event.get("type") == "Shot":
-                shot_data = event.get("shot", {})
-                xg_val = shot_data.get("statsbomb_xg", 0.0)
-
-                team = event.get("team", {}).get("id")
-                if team == home_team.get("home_team_id"):
-                    xg_a += xg_val
-                else:
-                    xg_b += xg_val
-
-        # Count passes (proxy for possession)
-        passes_a = sum(
-            1
-            for e in events
-            if e.get("type") == "Pass"
-            and e.get("team", {}).get("id") == home_team.get("home_team_id")
-        )
-        passes_b = sum(
-            1
-            for e in events
-            if e.get("type") == "Pass"
-            and e.get("team", {}).get("id") == away_team.get("away_team_id")
+            team = (event.get("team") or _EMPTY).get("id")
+            team_code = team_codes.get(team)
+            if team_code is None:
+                team_code = team_codes[team] = len(team_codes)
+
+            if type_code == SHOT:
+                shot_data = event.get("shot") or _EMPTY
+                xgs.append(shot_data.get("statsbomb_xg", 0.0))
+                goals.append((shot_data.get("outcome") or _EMPTY).get("name") == "Goal")
+            else:
+                xgs.append(0.0)
+                goals.append(False)
+
+            types.append(type_code)
+            teams.append(team_code)
+
+        return (
+            np.array(types, dtype=np.int8),
+            np.array(teams, dtype=np.int32),
+            np.array(xgs, dtype=np.float64),
+            np.array(goals, dtype=bool),
         )
 
-        # Count tackles (proxy for pressure)
-        tackles_a = sum(
-            1
-            for e in events
-            if e.get("type") == "Tackle"
-            and e.get("team", {}).get("id") == home_team.get("home_team_id")
-        )
-        tackles_b = sum(
-            1
-            for e in events
-            if e.get("type") == "Tackle"
-            and e.get("team", {}).get("id") == away_team.get("away_team_id")
-        )
+    def _match_columns(self, match: Dict) -> Tuple[EventArrays, int, int]:
+        """Event arrays plus (home, away) team codes for a match."""
+        match_id = match.get("match_id")
+        arrays = self.event_arrays.get(match_id)
+        if arrays is None:
+            arrays = self._build_event_arrays(self.events.get(match_id, []))
 
-        # Count shots
-        shots_a = sum(
-            1
-            for e in events
-            if e.get("type") == "Shot"
-            and e.get("team", {}).get("id") == home_team.get("home_team_id")
+        # Teams that never appear in events get a code no event can match
+        home_code = self._team_codes.get(
+            match.get("home_team", {}).get("home_team_id"), -1
         )
-        shots_b = sum(
-            1
-            for e in events
-            if e.get("type") == "Shot"
-            and e.get("team", {}).get("id") == away_team.get("away_team_id")
+        away_code = self._team_codes.get(
+            match.get("away_team", {}).get("away_team_id"), -1
         )
+        return arrays, home_code, away_code
+
+    @staticmethod
+    def _format_match_stats(
+        match: Dict,
+        goals_a: int,
+        goals_b: int,
+        xg_a: float,
+        xg_b: float,
+        passes_a: int,
+        passes_b: int,
+        tackles_a: int,
+        tackles_b: int,
+        shots_a: int,
+        shots_b: int,
+    ) -> Dict:
+        """Build the per-match stats dict from aggregated counters."""
+        home_team = match.get("home_team", {})
+        away_team = match.get("away_team", {})
 
         return {
-            "match_id": match_id,
+            "match_id": match.get("match_id"),
             "date": match.get("match_date", ""),
-            "team_a": team_a_name,
-            "team_b": team_b_name,
+            "team_a": home_team.get("home_team_name", "Team A"),
+            "team_b": away_team.get("away_team_name", "Team B"),
             "goals_a": goals_a,
             "goals_b": goals_b,
             "xg_a": round(xg_a, 3),
@@ -187,17 +322,53 @@ class StatsBombLoader:
             else 50.0,
         }
 
+    def extract_match_stats(self, match: Dict) -> Dict:
+        """
+        Extract key statistics from a match.
+
+        Args:
+            match: Match dictionary from StatsBomb
+
+        Returns:
+            Dictionary with: match_id, date, team_a, team_b, goals_a, goals_b, xg_a, xg_b, etc.
+        """
+        arrays, home_code, away_code = self._match_columns(match)
+        counters = _aggregate_event_arrays(*arrays, home_code, away_code)
+        return self._format_match_stats(match, *counters)
+
     def extract_all_stats(self) -> List[Dict]:
-        """Extract stats for all loaded matches."""
+        """
+        Extract stats for all loaded matches.
+
+        All matches are reduced together in one grouped NumPy pass rather
+        than one aggregation per match.
+        """
         if not self.matches:
             print("No matches loaded. Call load_matches() first.")
             return []
 
-        stats = []
+        matches = []
+        columns = []
+        team_codes = []
         for match in self.matches:
             try:
-                stat = self.extract_match_stats(match)
-                stats.append(stat)
+                arrays, home_code, away_code = self._match_columns(match)
+            except Exception as e:
+                print(f"Error extracting stats for match {match.get('match_id')}: {e}")
+                continue
+            matches.append(match)
+            columns.append(arrays)
+            team_codes.append((home_code, away_code))
+
+        if not matches:
+            return []
+
+        stats = []
+        for match, counters in zip(
+            matches, _aggregate_grouped_event_arrays(columns, team_codes)
+        ):
+            try:
+                stats.append(self._format_match_stats(match, *counters))
             except Exception as e:
                 print(f"Error extracting stats for match {match.get('match_id')}: {e}")
                 continue
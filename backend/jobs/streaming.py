@@ -3,11 +3,13 @@ backend/jobs/streaming.py
 Background job streaming and progress tracking
 """
 
+import secrets
 import threading
 import time
-import uuid
-from dataclasses import asdict, dataclass
-from typing import Callable, Dict, List, Optional
+from collections import OrderedDict, deque
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -27,28 +29,67 @@ class SweepProgress:
     estimated_remaining_seconds: float
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Single-level build; metrics is shared, not deep-copied like asdict
+        return {
+            "job_id": self.job_id,
+            "combo_index": self.combo_index,
+            "total_combos": self.total_combos,
+            "current_combo": self.current_combo,
+            "current_formation": self.current_formation,
+            "current_tactic": self.current_tactic,
+            "metrics": self.metrics,
+            "rank": self.rank,
+            "progress_percent": self.progress_percent,
+            "elapsed_seconds": self.elapsed_seconds,
+            "estimated_remaining_seconds": self.estimated_remaining_seconds,
+        }
+
+
+# Columns of a job's progress store (job_id is constant per job, not stored)
+PROGRESS_COLUMNS = tuple(f.name for f in fields(SweepProgress) if f.name != "job_id")
+
+# Progress points kept per job; older points are dropped first
+MAX_PROGRESS_POINTS = 10000
+
+# Completed jobs kept for status/replay; the oldest are evicted first
+MAX_COMPLETED_JOBS = 256
+
+# Sweep progress is emitted in batches of up to this many combos, or sooner
+# once this many seconds have passed since the last emit
+PROGRESS_BATCH_SIZE = 8
+PROGRESS_BATCH_INTERVAL = 0.25
 
 
 class StreamingJobManager:
-    """Manage background jobs and stream progress to clients."""
+    """
+    Manage background jobs and stream progress to clients.
+
+    self.lock only guards which jobs exist (the active/completed dicts);
+    each active job's progress has its own lock, so updates to different
+    jobs never contend with each other.
+    """
 
     def __init__(self):
         self.active_jobs: Dict[str, Dict] = {}
-        self.completed_jobs: Dict[str, Dict] = {}
+        self.completed_jobs: "OrderedDict[str, Dict]" = OrderedDict()
         self.lock = threading.Lock()
+        self._job_locks: Dict[str, threading.Lock] = {}
 
     def create_job(self, job_type: str, params: Dict) -> str:
         """Create a new streaming job."""
-        job_id = str(uuid.uuid4())[:8]
+        job_id = secrets.token_hex(4)
 
         with self.lock:
+            self._job_locks[job_id] = threading.Lock()
             self.active_jobs[job_id] = {
                 "id": job_id,
                 "type": job_type,
                 "params": params,
                 "created_at": time.time(),
-                "progress": [],
+                # Columnar (one bounded deque per SweepProgress field)
+                "progress": {
+                    name: deque(maxlen=MAX_PROGRESS_POINTS) for name in PROGRESS_COLUMNS
+                },
                 "status": "running",
             }
 
@@ -56,66 +97,136 @@ class StreamingJobManager:
 
     def update_progress(self, job_id: str, progress: SweepProgress):
         """Update progress for a job."""
-        if job_id not in self.active_jobs:
+        job = self.active_jobs.get(job_id)
+        job_lock = self._job_locks.get(job_id)
+        if job is None or job_lock is None:
             return False
 
-        with self.lock:
-            self.active_jobs[job_id]["progress"].append(progress.to_dict())
-            self.active_jobs[job_id]["last_update"] = time.time()
+        with job_lock:
+            # The job may have finished while we waited for its lock
+            columns = job.get("progress")
+            if columns is None:
+                return False
+            for name in PROGRESS_COLUMNS:
+                columns[name].append(getattr(progress, name))
+            job["last_update"] = time.time()
 
         return True
 
     def complete_job(self, job_id: str, result: Dict):
         """Mark job as complete."""
-        if job_id not in self.active_jobs:
-            return False
+        return self._finish_job(job_id, "completed", result=result)
+
+    def fail_job(self, job_id: str, error: str):
+        """Mark job as failed, keeping the error for status/replay."""
+        return self._finish_job(job_id, "error", error=error)
 
+    def _finish_job(self, job_id: str, status: str, **outcome) -> bool:
+        """Move an active job to completed_jobs with its final status."""
         with self.lock:
-            job = self.active_jobs.pop(job_id)
-            job["status"] = "completed"
-            job["result"] = result
+            job = self.active_jobs.pop(job_id, None)
+            if job is None:
+                return False
+            job_lock = self._job_locks.pop(job_id)
+
+            # Wait out any in-flight update, then drop the per-combo progress
+            # (the result carries the outcome); keep only its size
+            with job_lock:
+                job["progress_points"] = len(job.pop("progress")["combo_index"])
+
+            job["status"] = status
+            job.update(outcome)
             job["completed_at"] = time.time()
             self.completed_jobs[job_id] = job
+            while len(self.completed_jobs) > MAX_COMPLETED_JOBS:
+                self.completed_jobs.popitem(last=False)
 
         return True
 
+    @staticmethod
+    def _snapshot_progress(job: Dict) -> Dict[str, List]:
+        """Copy a job's progress columns into plain (JSON-friendly) lists."""
+        return {name: list(column) for name, column in job["progress"].items()}
+
     def get_job_status(self, job_id: str) -> Optional[Dict]:
         """Get current status of a job."""
         with self.lock:
             if job_id in self.active_jobs:
+                job = self.active_jobs[job_id]
+                with self._job_locks[job_id]:
+                    data = {**job, "progress": self._snapshot_progress(job)}
                 return {
                     "status": "running",
-                    "data": self.active_jobs[job_id],
+                    "data": data,
                 }
             elif job_id in self.completed_jobs:
+                job = self.completed_jobs[job_id]
                 return {
-                    "status": "completed",
-                    "data": self.completed_jobs[job_id],
+                    # "completed", or "error" for jobs recorded via fail_job
+                    "status": job["status"],
+                    "data": job,
                 }
 
         return None
 
     def get_latest_progress(self, job_id: str) -> Optional[Dict]:
-        """Get latest progress update for a job."""
-        with self.lock:
-            if job_id in self.active_jobs:
-                progress_list = self.active_jobs[job_id]["progress"]
-                if progress_list:
-                    return progress_list[-1]
+        """Get latest progress update for a job (rebuilt from its columns)."""
+        job = self.active_jobs.get(job_id)
+        job_lock = self._job_locks.get(job_id)
+        if job is None or job_lock is None:
+            return None
+
+        with job_lock:
+            # The job may have finished while we waited for its lock
+            columns = job.get("progress")
+            if columns is not None and columns["combo_index"]:
+                latest = {"job_id": job_id}
+                for name in PROGRESS_COLUMNS:
+                    latest[name] = columns[name][-1]
+                return latest
 
         return None
 
     def cancel_job(self, job_id: str) -> bool:
         """Mark a job for cancellation."""
-        if job_id not in self.active_jobs:
-            return False
-
         with self.lock:
+            if job_id not in self.active_jobs:
+                return False
             self.active_jobs[job_id]["status"] = "cancelled"
 
         return True
 
 
+def _ranked_entry(rank: int, raw: Tuple) -> Dict:
+    """Build the emitted (rounded) form of one ranked sweep combo."""
+    (
+        score,
+        formation,
+        tactic,
+        xg_val,
+        xg_delta,
+        goal_prob,
+        goal_prob_delta,
+        momentum,
+        momentum_delta,
+    ) = raw
+    return {
+        "rank": rank,
+        "formation": formation,
+        "tactic": tactic,
+        "combo": f"{formation}_{tactic}",
+        "score": round(score, 4),
+        "metrics": {
+            "xg": round(xg_val, 3),
+            "xg_delta": round(xg_delta, 3),
+            "goal_probability": round(goal_prob, 4),
+            "goal_prob_delta": round(goal_prob_delta, 4),
+            "momentum_pmu": round(momentum, 2),
+            "momentum_delta": round(momentum_delta, 2),
+        },
+    }
+
+
 def run_streaming_sweep(
     socketio,
     job_id: str,
@@ -130,6 +241,7 @@ def run_streaming_sweep(
     rank_by: str,
     simulator_fn: Callable,
     analyzer_fn: Callable,
+    job_manager: Optional[StreamingJobManager] = None,
 ):
     """
     Run sweep simulation with real-time progress streaming.
@@ -143,16 +255,24 @@ def run_streaming_sweep(
         iterations: MC iterations per combo
         simulator_fn: Function to run simulation
         analyzer_fn: Function to compute analytics
+        job_manager: Optional manager to record the final result in
+
+    Events are emitted to the job's room (clients join it via subscribe_job)
+    rather than to every connected client. Progress is coalesced into
+    sweep_progress_batch events (a list of per-combo progress dicts).
     """
 
     try:
         t0 = time.time()
-        results = {}
+        results: Dict[Tuple[str, str], Dict] = {}
         baseline_result = None
 
         total_combos = len(formations) * len(tactics)
         combo_index = 0
 
+        pending_progress = []
+        last_emit = t0
+
         # Run each combination
         for formation in formations:
             for tactic in tactics:
@@ -176,7 +296,7 @@ def run_streaming_sweep(
                 # Run simulation
                 result = simulator_fn(config)
                 result = analyzer_fn(result, config)
-                results[combo_key] = result
+                results[(formation, tactic)] = result
 
                 # Track baseline
                 if formation == "4-3-3" and tactic == "balanced":
@@ -213,11 +333,20 @@ def run_streaming_sweep(
                     "timestamp": time.time(),
                 }
 
-                # Send to all connected clients
-                socketio.emit("sweep_progress", progress_data, broadcast=True)
-
-                # Small delay to allow UI updates
-                time.sleep(0.01)
+                # Send to clients subscribed to this job, coalesced
+                pending_progress.append(progress_data)
+                now = time.time()
+                if (
+                    len(pending_progress) >= PROGRESS_BATCH_SIZE
+                    or now - last_emit >= PROGRESS_BATCH_INTERVAL
+                ):
+                    socketio.emit("sweep_progress_batch", pending_progress, to=job_id)
+                    pending_progress = []
+                    last_emit = now
+
+        # Flush progress not yet sent
+        if pending_progress:
+            socketio.emit("sweep_progress_batch", pending_progress, to=job_id)
 
         # Rank final results
         ranked = []
@@ -239,8 +368,12 @@ def run_streaming_sweep(
         )
         baseline_risk_score = risk_level_order.get(baseline_risk, 1)
 
-        for combo_key, result in results.items():
-            formation, tactic = combo_key.split("_")
+        # Position of the rank_by metric in each combo's delta tuple
+        score_index = {"xg": 0, "goal_prob": 1, "momentum": 2, "risk": 3}.get(
+            rank_by, 0
+        )
+
+        for (formation, tactic), result in results.items():
 
             xg_val = result.get("xg", 0.03)
             goal_prob = result.get("goalProbability", 0.01)
@@ -255,36 +388,29 @@ def run_streaming_sweep(
             momentum_delta = momentum - baseline_momentum
             risk_delta = risk_score - baseline_risk_score
 
-            scoring = {
-                "xg": xg_delta,
-                "goal_prob": goal_prob_delta,
-                "momentum": momentum_delta,
-                "risk": -risk_delta,
-            }
-
-            score = scoring.get(rank_by, xg_delta)
+            score = (xg_delta, goal_prob_delta, momentum_delta, -risk_delta)[
+                score_index
+            ]
 
+            # Raw floats for ranking; rounded once when the entry is built
             ranked.append(
-                {
-                    "rank": 0,
-                    "formation": formation,
-                    "tactic": tactic,
-                    "combo": combo_key,
-                    "score": round(score, 4),
-                    "metrics": {
-                        "xg": round(xg_val, 3),
-                        "xg_delta": round(xg_delta, 3),
-                        "goal_probability": round(goal_prob, 4),
-                        "goal_prob_delta": round(goal_prob_delta, 4),
-                        "momentum_pmu": round(momentum, 2),
-                        "momentum_delta": round(momentum_delta, 2),
-                    },
-                }
+                (
+                    score,
+                    formation,
+                    tactic,
+                    xg_val,
+                    xg_delta,
+                    goal_prob,
+                    goal_prob_delta,
+                    momentum,
+                    momentum_delta,
+                )
             )
 
-        ranked.sort(key=lambda x: x["score"], reverse=True)
-        for idx, item in enumerate(ranked):
-            item["rank"] = idx + 1
+        # The full ranking is returned, so a full (C-level keyed) sort is needed;
+        # top/bottom 3 are then plain slices
+        ranked.sort(key=itemgetter(0), reverse=True)
+        ranked = [_ranked_entry(idx + 1, raw) for idx, raw in enumerate(ranked)]
 
         # Final result
         final_result = {
@@ -295,6 +421,10 @@ def run_streaming_sweep(
             "elapsed_seconds": round(time.time() - t0, 2),
         }
 
+        # Record the result first so late subscribers can be replayed it
+        if job_manager is not None:
+            job_manager.complete_job(job_id, final_result)
+
         # Emit completion
         socketio.emit(
             "sweep_complete",
@@ -303,11 +433,16 @@ def run_streaming_sweep(
                 "result": final_result,
                 "timestamp": time.time(),
             },
-            broadcast=True,
+            to=job_id,
         )
 
     except Exception as e:
         print(f"Error in streaming sweep: {e}")
+
+        # Record the failure first so late subscribers can be replayed it
+        if job_manager is not None:
+            job_manager.fail_job(job_id, str(e))
+
         socketio.emit(
             "sweep_error",
             {
@@ -315,5 +450,5 @@ def run_streaming_sweep(
                 "error": str(e),
                 "timestamp": time.time(),
             },
-            broadcast=True,
+            to=job_id,
         )
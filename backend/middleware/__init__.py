@@ -3,7 +3,7 @@ backend/middleware/__init__.py
 Middleware package for API validation, error handling, and rate limiting
 """
 
-from .error_handler import ErrorHandler
+from .error_handler import ErrorHandler, get_api_log_handler
 from .rate_limiter import (
     RateLimiterConfig,
     get_rate_limit_decorator,
@@ -40,6 +40,7 @@ __all__ = [
     "sanitize_string",
     "format_validation_error",
     "ErrorHandler",
+    "get_api_log_handler",
     "RateLimiterConfig",
     "setup_rate_limiter",
     "get_rate_limit_decorator",
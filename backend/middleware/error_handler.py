@@ -3,12 +3,66 @@ backend/middleware/error_handler.py
 Centralized error handling and request tracking
 """
 
+import atexit
 import logging
+import queue
+import secrets
+import time
 import traceback
-import uuid
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-from flask import g, jsonify, request
+from flask import g, has_request_context, jsonify, request
+
+API_LOG_FILE = "backend/logs/api.log"
+API_LOG_MAX_BYTES = 50_000_000
+API_LOG_BACKUP_COUNT = 5
+
+_api_log_handler = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request ID ("-" outside a request)."""
+
+    def filter(self, record):
+        if not hasattr(record, "request_id"):
+            record.request_id = (
+                getattr(g, "request_id", "-") if has_request_context() else "-"
+            )
+        return True
+
+
+def get_api_log_handler() -> QueueHandler:
+    """
+    Shared handler for backend/logs/api.log.
+
+    Callers only enqueue records; a single listener thread formats them and
+    writes to a size-rotated file, so rotation is safe across loggers.
+    """
+    global _api_log_handler
+    if _api_log_handler is None:
+        file_handler = RotatingFileHandler(
+            API_LOG_FILE,
+            maxBytes=API_LOG_MAX_BYTES,
+            backupCount=API_LOG_BACKUP_COUNT,
+        )
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s"
+            )
+        )
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        handler = QueueHandler(log_queue)
+        handler.setLevel(logging.INFO)
+        # request_id must be read on the request thread, before enqueueing
+        handler.addFilter(RequestIdFilter())
+        _api_log_handler = handler
+
+    return _api_log_handler
 
 
 class ErrorHandler:
@@ -24,16 +78,10 @@ class ErrorHandler:
         logger = logging.getLogger("momentum_api")
         logger.setLevel(logging.INFO)
 
-        # File handler
-        handler = logging.FileHandler("backend/logs/api.log")
-        handler.setLevel(logging.INFO)
-
-        # Formatting
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # Queued, rotating file handler (formatting happens off-request)
+        handler = get_api_log_handler()
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
 
         return logger
 
@@ -43,15 +91,15 @@ class ErrorHandler:
         @self.app.before_request
         def before_request():
             """Attach request ID and timestamp to all requests."""
-            g.request_id = str(uuid.uuid4())[:8]
-            g.request_start_time = datetime.utcnow()
+            g.request_id = secrets.token_hex(4)
+            g.request_start_ns = time.monotonic_ns()
             g.request_user_ip = request.remote_addr
 
         @self.app.after_request
         def after_request(response):
             """Log all requests."""
             if hasattr(g, "request_id"):
-                duration = (datetime.utcnow() - g.request_start_time).total_seconds()
+                duration = (time.monotonic_ns() - g.request_start_ns) / 1e9
                 self.logger.info(
                     f"{request.method} {request.path} - Status: {response.status_code} - "
                     f"Duration: {duration:.2f}s - IP: {g.request_user_ip}"
@@ -3,10 +3,19 @@ backend/middleware/rate_limiter.py
 Rate limiting to prevent API abuse
 """
 
+import os
+
 from flask import jsonify
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 
 class RateLimiterConfig:
     """Rate limiting configuration"""
@@ -23,8 +32,12 @@ class RateLimiterConfig:
     # Bypass for local development (can be disabled in production)
     ENABLED = True
 
-    # Storage backend: memory (dev) or redis (prod)
-    STORAGE_URI = "memory://"  # Use "redis://localhost:6379" for production
+    # Storage backend: memory (dev) or redis (prod), e.g.
+    # REDIS_URL=redis://localhost:6379 to share counters across workers
+    STORAGE_URI = os.environ.get("REDIS_URL", "memory://")
+
+    # Connections shared by all rate-limit checks in one process (redis only)
+    REDIS_MAX_CONNECTIONS = 32
 
 
 def setup_rate_limiter(app, storage_uri=None):
@@ -33,7 +46,8 @@ def setup_rate_limiter(app, storage_uri=None):
 
     Args:
         app: Flask application
-        storage_uri: Redis URI or None for in-memory (dev only)
+        storage_uri: Storage URI, or None for RateLimiterConfig.STORAGE_URI
+            (REDIS_URL if set, else in-memory)
 
     Returns:
         Limiter instance
@@ -42,12 +56,26 @@ def setup_rate_limiter(app, storage_uri=None):
     if storage_uri is None:
         storage_uri = RateLimiterConfig.STORAGE_URI
 
+    strategy = "fixed-window"  # Simple fixed-window strategy
+    storage_options = {}
+    if storage_uri.startswith(("redis://", "rediss://")):
+        # Moving window runs as a single Lua script per check on redis
+        strategy = "moving-window"
+        if REDIS_AVAILABLE:
+            storage_options["connection_pool"] = redis.BlockingConnectionPool.from_url(
+                storage_uri, max_connections=RateLimiterConfig.REDIS_MAX_CONNECTIONS
+            )
+
+    # Keyed on the bare client IP: flask-limiter already scopes each counter
+    # by endpoint, so folding the endpoint (or a hash of it) into the key
+    # would only add per-request work without changing what is counted.
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,
         default_limits=[RateLimiterConfig.DEFAULT_LIMIT],
         storage_uri=storage_uri,
-        strategy="fixed-window",  # Simple fixed-window strategy
+        storage_options=storage_options,
+        strategy=strategy,
     )
 
     # Custom error handler for rate limiting
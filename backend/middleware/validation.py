@@ -3,10 +3,17 @@ backend/middleware/validation.py
 Input validation and error handling for API endpoints
 """
 
-import re
-from functools import wraps
+import sys
+from functools import lru_cache, wraps
 
-from flask import jsonify, request
+from flask import g, jsonify, request
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class ValidationError(Exception):
@@ -15,7 +22,10 @@ class ValidationError(Exception):
     pass
 
 
-PRESET_FORMATIONS = [
+# Characters stripped by sanitize_string (str.translate deletion table)
+_SANITIZE_TABLE = str.maketrans("", "", "<>\"'%;()&+")
+
+PRESET_FORMATIONS = (
     "4-3-3",
     "4-4-2",
     "3-5-2",
@@ -24,22 +34,40 @@ PRESET_FORMATIONS = [
     "3-4-3",
     "4-2-3-1",
     "4-1-4-1",
-    "3-4-3",
     "4-3-2-1",
-]
+)
+# Preset -> its interned canonical string (returned instead of the input copy)
+_PRESET_CANONICAL = {sys.intern(f): sys.intern(f) for f in PRESET_FORMATIONS}
 
+# Error messages with no per-call parts are built once at import
+_ERR_FORMATION_SYNTAX = (
+    "Formation must be digits separated by hyphens (e.g. 4-3-3, 4-2-3-1). "
+    f"Presets: {', '.join(PRESET_FORMATIONS[:6])}"
+)
+_ERR_FORMATION_TOTAL = (
+    "Formation must have exactly 10 outfield players (got {total}). "
+    "Adjust line counts to sum to 10."
+)
+_ERR_NOT_JSON = "Request body must be JSON"
 
-def validate_formation(formation_name: str) -> str:
-    """
-    Validate a formation string.
 
-    Accepts both preset formations and any custom N-N-...-N pattern where:
-      - Each part is 1–6 players
-      - Total outfield players = 10
-      - 2–5 lines (not counting GK)
+# Lower-cased tactic -> interned canonical string
+_VALID_TACTICS = {
+    t: sys.intern(t) for t in ("aggressive", "balanced", "defensive", "possession")
+}
+_ERR_INVALID_TACTIC = (
+    "Invalid tactic. Must be one of: aggressive, balanced, defensive, possession"
+)
 
-    Examples: '4-3-3', '4-2-3-1', '3-4-2-1', '5-2-3'
-    """
+_DIGIT_VALUES = {str(d): d for d in range(10)}
+
+
+def _raise_formation_syntax():
+    raise ValidationError(_ERR_FORMATION_SYNTAX)
+
+
+def _check_formation(formation_name):
+    """Uncached body of validate_formation."""
     if not isinstance(formation_name, str):
         raise ValidationError("Formation must be a string")
 
@@ -48,93 +76,170 @@ def validate_formation(formation_name: str) -> str:
     if not formation_name:
         raise ValidationError("Formation cannot be empty")
 
-    # Check pattern: digits separated by hyphens
-    if not re.match(r"^\d+(-\d+)+$", formation_name):
-        raise ValidationError(
-            "Formation must be digits separated by hyphens (e.g. 4-3-3, 4-2-3-1). "
-            f"Presets: {', '.join(PRESET_FORMATIONS[:6])}"
-        )
-
-    parts = [int(x) for x in formation_name.split("-")]
+    # Presets are known-valid
+    preset = _PRESET_CANONICAL.get(formation_name)
+    if preset is not None:
+        return preset
+
+    # Single left-to-right scan: syntax (digits separated by hyphens), line
+    # sizes, line count and total are all gathered in one pass. Syntax errors
+    # take precedence, so range problems are only flagged until the end.
+    total = 0
+    lines = 0
+    cur = 0
+    in_line = False
+    bad_line = False
+    for ch in formation_name:
+        if ch == "-":
+            if not in_line:
+                _raise_formation_syntax()
+            if cur < 1 or cur > 6:
+                bad_line = True
+            total += cur
+            lines += 1
+            cur = 0
+            in_line = False
+        else:
+            digit = _DIGIT_VALUES.get(ch)
+            if digit is None:
+                if not ch.isdecimal():
+                    _raise_formation_syntax()
+                digit = int(ch)
+            # Past 6 the exact value no longer matters; stop growing it
+            if cur <= 6:
+                cur = cur * 10 + digit
+            in_line = True
+
+    if not in_line or lines == 0:
+        _raise_formation_syntax()
+    if cur < 1 or cur > 6:
+        bad_line = True
+    total += cur
+    lines += 1
 
     # Each line must have 1–6 players
-    for p in parts:
-        if p < 1 or p > 6:
-            raise ValidationError("Each line must have between 1 and 6 players")
+    if bad_line:
+        raise ValidationError("Each line must have between 1 and 6 players")
 
     # Must sum to 10 outfield players (GK is separate)
-    total = sum(parts)
     if total != 10:
-        raise ValidationError(
-            f"Formation must have exactly 10 outfield players (got {total}). "
-            "Adjust line counts to sum to 10."
-        )
+        raise ValidationError(_ERR_FORMATION_TOTAL.format(total=total))
 
     # 2–5 lines
-    if len(parts) < 2:
+    if lines < 2:
         raise ValidationError("Formation must have at least 2 lines")
-    if len(parts) > 5:
+    if lines > 5:
         raise ValidationError("Formation can have at most 5 lines")
 
     return formation_name
 
 
+_check_formation_cached = lru_cache(maxsize=128)(_check_formation)
+
+
+def validate_formation(formation_name: str) -> str:
+    """
+    Validate a formation string.
+
+    Accepts both preset formations and any custom N-N-...-N pattern where:
+      - Each part is 1–6 players
+      - Total outfield players = 10
+      - 2–5 lines (not counting GK)
+
+    Examples: '4-3-3', '4-2-3-1', '3-4-2-1', '5-2-3'
+
+    Successful results for string input are memoized.
+    """
+    if isinstance(formation_name, str):
+        return _check_formation_cached(formation_name)
+    return _check_formation(formation_name)
+
+
+def _check_tactic(tactic_name):
+    """Uncached body of validate_tactic."""
+    tactic = _VALID_TACTICS.get(tactic_name.lower())
+    if tactic is None:
+        raise ValidationError(_ERR_INVALID_TACTIC)
+    return tactic
+
+
+_check_tactic_cached = lru_cache(maxsize=16)(_check_tactic)
+
+
 def validate_tactic(tactic_name: str) -> str:
-    """Validate tactic string."""
-    valid_tactics = ["aggressive", "balanced", "defensive", "possession"]
-    if tactic_name.lower() not in valid_tactics:
-        raise ValidationError(
-            f"Invalid tactic. Must be one of: {', '.join(valid_tactics)}"
-        )
-    return tactic_name.lower()
+    """Validate tactic string (successful string lookups are memoized)."""
+    if isinstance(tactic_name, str):
+        return _check_tactic_cached(tactic_name)
+    return _check_tactic(tactic_name)
 
 
-def validate_iterations(iterations: int) -> int:
-    """Validate iteration count."""
-    try:
-        iters = int(iterations)
-    except (ValueError, TypeError):
-        raise ValidationError("Iterations must be an integer")
+def _bounded_number(value, cast, lo, hi, type_error, low_error, high_error=None):
+    """Cast value with cast() and check lo <= value <= hi, raising the given messages."""
+    # Already the target type (the usual JSON case): no conversion call needed
+    if type(value) is cast:
+        number = value
+    else:
+        try:
+            number = cast(value)
+        except (ValueError, TypeError):
+            raise ValidationError(type_error)
 
-    if iters < 10:
-        raise ValidationError("Iterations must be at least 10")
-    if iters > 2000:
-        raise ValidationError("Iterations max is 2000")
+    if number < lo:
+        raise ValidationError(low_error)
+    if number > hi:
+        raise ValidationError(high_error or low_error)
 
-    return iters
+    return number
 
 
-def validate_crowd_noise(noise: float) -> float:
-    """Validate crowd noise dB level."""
-    try:
-        noise_val = float(noise)
-    except (ValueError, TypeError):
-        raise ValidationError("Crowd noise must be a float")
+def validate_iterations(iterations: int) -> int:
+    """Validate iteration count."""
+    return _bounded_number(
+        iterations,
+        int,
+        10,
+        2000,
+        "Iterations must be an integer",
+        "Iterations must be at least 10",
+        "Iterations max is 2000",
+    )
 
-    if noise_val < 0 or noise_val > 120:
-        raise ValidationError("Crowd noise must be between 0-120 dB")
 
-    return noise_val
+def validate_crowd_noise(noise: float) -> float:
+    """Validate crowd noise dB level."""
+    return _bounded_number(
+        noise,
+        float,
+        0,
+        120,
+        "Crowd noise must be a float",
+        "Crowd noise must be between 0-120 dB",
+    )
 
 
 def validate_minute(minute: int) -> int:
     """Validate match minute."""
-    try:
-        min_val = int(minute)
-    except (ValueError, TypeError):
-        raise ValidationError("Minute must be an integer")
+    return _bounded_number(
+        minute, int, 0, 90, "Minute must be an integer", "Minute must be between 0-90"
+    )
 
-    if min_val < 0 or min_val > 90:
-        raise ValidationError("Minute must be between 0-90")
 
-    return min_val
+def _check_player_id(player_id):
+    """Uncached body of validate_player_id."""
+    # "A" or "B" followed by one or more digits (the old ^[AB]\d+$ pattern)
+    if not (player_id[:1] in ("A", "B") and player_id[1:].isdecimal()):
+        raise ValidationError("Player ID must be format A1-A11 or B1-B11")
+    return player_id
+
+
+_check_player_id_cached = lru_cache(maxsize=64)(_check_player_id)
 
 
 def validate_player_id(player_id: str) -> str:
-    """Validate player ID format."""
-    if not re.match(r"^[AB]\d+$", player_id):
-        raise ValidationError("Player ID must be format A1-A11 or B1-B11")
-    return player_id
+    """Validate player ID format (successful string lookups are memoized)."""
+    if isinstance(player_id, str):
+        return _check_player_id_cached(player_id)
+    return _check_player_id(player_id)
 
 
 def validate_scenario_name(name: str) -> str:
@@ -148,25 +253,54 @@ def validate_scenario_name(name: str) -> str:
     return name.strip()
 
 
+def _clean_tag(tag) -> str:
+    """Normalize one tag ("" for blank tags, which are dropped)."""
+    if not isinstance(tag, str):
+        raise ValidationError("Each tag must be a string")
+    sanitized = tag.strip().lower()
+    if len(sanitized) > 50:
+        raise ValidationError("Tag must be at most 50 characters")
+    return sanitized
+
+
+def _dedupe_tags(tags) -> tuple:
+    """Clean tags and de-duplicate them in first-seen order."""
+    valid_tags = [tag for tag in map(_clean_tag, tags) if tag]
+
+    # The cap counts every non-blank tag, duplicates included
+    if len(valid_tags) > 20:
+        raise ValidationError("Max 20 tags per scenario")
+
+    return tuple(dict.fromkeys(valid_tags))
+
+
+_dedupe_tags_cached = lru_cache(maxsize=512)(_dedupe_tags)
+
+# Longest raw tag list that is memoized; keeps client-sized lists out of the
+# cache (a valid list has at most 20 non-blank tags anyway)
+_MAX_CACHED_TAGS = 20
+
+
 def validate_tags(tags: list) -> list:
-    """Validate tags list."""
+    """Validate tags list (short all-string tag lists are memoized by content)."""
     if not isinstance(tags, list):
         raise ValidationError("Tags must be a list")
 
-    valid_tags = []
-    for tag in tags:
-        if not isinstance(tag, str):
-            raise ValidationError("Each tag must be a string")
-        sanitized = tag.strip().lower()
-        if len(sanitized) > 50:
-            raise ValidationError("Tag must be at most 50 characters")
-        if sanitized:
-            valid_tags.append(sanitized)
+    if len(tags) <= _MAX_CACHED_TAGS and all(type(tag) is str for tag in tags):
+        return list(_dedupe_tags_cached(tuple(tags)))
+    return list(_dedupe_tags(tags))
 
-    if len(valid_tags) > 20:
-        raise ValidationError("Max 20 tags per scenario")
 
-    return list(set(valid_tags))  # Remove duplicates
+def _is_hex8(sid: str) -> bool:
+    """True for exactly 8 lowercase hex characters (checked by bytes.fromhex in C)."""
+    if len(sid) != 8:
+        return False
+    try:
+        raw = bytes.fromhex(sid)
+    except ValueError:
+        return False
+    # fromhex skips whitespace and accepts uppercase; rule both out
+    return len(raw) == 4 and sid == sid.lower()
 
 
 def validate_scenario_ids(scenario_ids: list) -> list:
@@ -181,30 +315,57 @@ def validate_scenario_ids(scenario_ids: list) -> list:
     for sid in scenario_ids:
         if not isinstance(sid, str):
             raise ValidationError("Each scenario_id must be a string")
-        if not re.match(r"^[a-f0-9]{8}$", sid):
+        if not _is_hex8(sid):
             raise ValidationError("Invalid scenario ID format")
 
     return scenario_ids
 
 
+def _parse_json_body():
+    """Parse the request body as JSON (orjson when available); None if invalid."""
+    if not ORJSON_AVAILABLE:
+        return request.get_json(silent=True, cache=True)
+    try:
+        return orjson.loads(request.get_data(cache=True))
+    except orjson.JSONDecodeError:
+        return None
+
+
 def validate_json_request(required_fields=None):
     """Decorator to validate JSON request body."""
-    if required_fields is None:
-        required_fields = []
+    # Fixed per decorated route: ordered for error messages, a set for the
+    # single C-level subset check on the common (all-present) path
+    required_order = tuple(required_fields or ())
+    required_set = frozenset(required_order)
 
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            # Reject non-JSON / empty bodies before attempting a parse
+            if not request.is_json:
+                return (
+                    jsonify({"ok": False, "error": _ERR_NOT_JSON}),
+                    415,
+                )
+            if request.content_length == 0:
+                return (
+                    jsonify({"ok": False, "error": _ERR_NOT_JSON}),
+                    400,
+                )
+
             try:
-                data = request.get_json(silent=True)
+                data = _parse_json_body()
                 if data is None:
                     return (
-                        jsonify({"ok": False, "error": "Request body must be JSON"}),
+                        jsonify({"ok": False, "error": _ERR_NOT_JSON}),
                         400,
                     )
 
-                for field in required_fields:
-                    if field not in data:
+                if required_set and not (
+                    isinstance(data, dict) and data.keys() >= required_set
+                ):
+                    field = next((k for k in required_order if k not in data), None)
+                    if field is not None:
                         return (
                             jsonify(
                                 {
@@ -215,8 +376,8 @@ def validate_json_request(required_fields=None):
                             400,
                         )
 
-                # Store validated data in request context
-                request.validated_data = data
+                # Store validated data in the request context (flask.g)
+                g.validated_data = data
                 return f(*args, **kwargs)
 
             except Exception as e:
@@ -237,7 +398,7 @@ def sanitize_string(value: str, max_length: int = 500) -> str:
         raise ValidationError(f"String exceeds max length of {max_length}")
 
     # Remove potentially dangerous characters
-    value = re.sub(r"[<>\"\'%;()&+]", "", value)
+    value = value.translate(_SANITIZE_TABLE)
 
     return value
 
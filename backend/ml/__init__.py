@@ -1,19 +1,21 @@
 """ML-powered tactical recommendations module"""
 
-from .policy_trainer import (
-    PolicyTrainer,
-    TacticalPolicyNetwork,
-    TrainingState,
-    TrainingTransition,
-    create_trainer,
-    train_policy_async,
-)
-
 __all__ = [
     "TacticalPolicyNetwork",
     "PolicyTrainer",
     "TrainingState",
     "TrainingTransition",
+    "TransitionBuffer",
     "create_trainer",
     "train_policy_async",
 ]
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: policy_trainer (and TensorFlow with it) is only
+    # imported the first time one of its names is accessed.
+    if name in __all__:
+        from . import policy_trainer
+
+        return getattr(policy_trainer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,22 +14,198 @@ import json
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 try:
+    import tensorflow as tf
     from tensorflow import keras
     from tensorflow.keras import layers
 
     TF_AVAILABLE = True
 except ImportError:
     TF_AVAILABLE = False
+    tf = None
     keras = None
     layers = None
     print("Warning: TensorFlow not installed. Policy training disabled.")
 
+try:
+    from coaching.coaching_knowledge import (
+        get_coach_recommendations_for_state,
+        get_coach_tactical_profile,
+    )
+
+    COACHING_AVAILABLE = True
+except ImportError:
+    COACHING_AVAILABLE = False
+    get_coach_recommendations_for_state = None
+    get_coach_tactical_profile = None
+
+
+# Network input: [formation, tactic, possession, fatigue, momentum, opp_formation,
+# opp_tactic], each normalized as (value + offset) / scale
+STATE_DIM = 7
+_STATE_OFFSET = np.array([0.0, 0.0, 0.0, 0.0, 5.0, 0.0, 0.0])
+_STATE_SCALE = np.array([3.0, 3.0, 100.0, 100.0, 10.0, 3.0, 3.0])
+_STATE_FIELDS = attrgetter(
+    "formation_id",
+    "tactic_id",
+    "possession_pct",
+    "team_fatigue",
+    "momentum_pmu",
+    "opponent_formation_id",
+    "opponent_tactic_id",
+)
+
+# Heuristic scoring tables over the 16 actions (action_id = formation * 4 + tactic):
+# row k of a one-hot table is 1.0 for the actions using formation/tactic k
+_ACTION_FORMATION, _ACTION_TACTIC = np.divmod(np.arange(16), 4)
+_FORMATION_ONEHOT = (_ACTION_FORMATION == np.arange(4)[:, None]).astype(np.float64)
+_TACTIC_ONEHOT = (_ACTION_TACTIC == np.arange(4)[:, None]).astype(np.float64)
+
+# Per-rule score vectors, pre-summed so each rule that fires is one array add.
+# Pre-summing keeps results bit-identical: the possession rule is always added
+# first (onto zeros), and every other rule hits each action with one term at most.
+_F, _T = _FORMATION_ONEHOT, _TACTIC_ONEHOT
+_HEURISTIC_RULES = {
+    # Possession: possession / aggressive_press when ahead / 4-3-3
+    "possession_high": 0.4 * _T[3] + 0.3 * _T[1] + 0.2 * _F[0],
+    # deep_defense / 5-3-2 (defensive)
+    "possession_low": 0.4 * _T[2] + 0.3 * _F[3],
+    # balanced / 4-2-3-1 (balanced)
+    "possession_even": 0.3 * _T[0] + 0.2 * _F[1],
+    # Fatigue: balanced or defensive (less intensive), avoid aggressive tactics
+    "fatigue_high": np.where(_T[0] + _T[2], 0.3, -0.2),
+    # pressing or possession (more intensive)
+    "fatigue_low": 0.3 * (_T[1] + _T[3]),
+    # Momentum with us: aggressive_press / possession - maintain control
+    "momentum_up": 0.4 * _T[1] + 0.2 * _T[3],
+    # Momentum against us: deep_defense - absorb pressure / balanced
+    "momentum_down": 0.4 * _T[2] + 0.2 * _T[0],
+    # Winning: deep_defense - protect lead / balanced - maintain
+    "winning": 0.3 * _T[2] + 0.2 * _T[0],
+    # Losing: aggressive_press - create chances / possession - control game
+    "losing": 0.35 * _T[1] + 0.25 * _T[3],
+}
+# Same formation as the opponent can indicate familiarity
+_FORMATION_MATCH_BONUS = 0.1 * _F
+_OPPONENT_FORMATIONS = frozenset(range(4))
+# possession (id=3) slightly favored
+_BASE_TACTIC_BONUS = np.array([0.1, 0.15, 0.12, 0.2])[_ACTION_TACTIC]
+del _F, _T
+
+
+@lru_cache(maxsize=64)
+def _coach_tactic_bonus(coach_name: str) -> Tuple[float, float, float, float]:
+    """Training-reward bonus per tactic_id for actions aligned with a coach"""
+    coach = get_coach_tactical_profile(coach_name)
+    if not coach:
+        return (0.0, 0.0, 0.0, 0.0)
+    return (
+        0.03 if 0.4 < coach.pressing_intensity < 0.7 else 0.0,  # balanced
+        0.05 if coach.pressing_intensity > 0.7 else 0.0,  # aggressive_press
+        0.0,  # deep_defense
+        0.05 if coach.possession_preference > 0.7 else 0.0,  # possession
+    )
+
+
+def _band(value: float, low: float, high: float) -> int:
+    """1 above high, -1 below low, else 0 (the heuristic's threshold bands)"""
+    if value > high:
+        return 1
+    if value < low:
+        return -1
+    return 0
+
+
+def _score_actions(
+    possession_band: int,
+    fatigue_band: int,
+    momentum_band: int,
+    score_band: int,
+    opponent_formation_id: int,
+) -> np.ndarray:
+    """Heuristic scores for all 16 actions (fallback path, no TensorFlow)"""
+    rules = _HEURISTIC_RULES
+    scores = np.zeros(16)
+
+    if possession_band > 0:
+        scores += rules["possession_high"]
+    elif possession_band < 0:
+        scores += rules["possession_low"]
+    else:
+        scores += rules["possession_even"]
+
+    if fatigue_band > 0:
+        scores += rules["fatigue_high"]
+    elif fatigue_band < 0:
+        scores += rules["fatigue_low"]
+
+    if momentum_band > 0:
+        scores += rules["momentum_up"]
+    elif momentum_band < 0:
+        scores += rules["momentum_down"]
+
+    if score_band > 0:
+        scores += rules["winning"]
+    elif score_band < 0:
+        scores += rules["losing"]
+
+    if opponent_formation_id >= 0:
+        scores += _FORMATION_MATCH_BONUS[opponent_formation_id]
+
+    scores += _BASE_TACTIC_BONUS
+    return scores
+
+
+# The heuristic only depends on which band each state feature falls in, so its
+# result is a lookup over at most 3 * 3 * 3 * 3 * 5 = 405 keys
+@lru_cache(maxsize=None)
+def _heuristic_recommendation(
+    possession_band: int,
+    fatigue_band: int,
+    momentum_band: int,
+    score_band: int,
+    opponent_formation_id: int,
+) -> Tuple[int, float, float]:
+    """(action_id, q_value_estimate, confidence) for one band combination"""
+    scores = _score_actions(
+        possession_band, fatigue_band, momentum_band, score_band, opponent_formation_id
+    )
+
+    # Get best action
+    best_action = int(np.argmax(scores))
+    best_score = float(scores[best_action])
+
+    # Normalize score to confidence (0-1 range); best_score is the max
+    lowest = float(scores.min())
+    confidence = min(1.0, max(0.0, (best_score - lowest) / (best_score - lowest + 0.1)))
+
+    return best_action, best_score, confidence
+
+
+def _raw_state_matrix(states: List["TrainingState"]) -> np.ndarray:
+    """Unnormalized (n, 7) float64 matrix of the network-input fields"""
+    # Fields stream straight into a preallocated buffer (no intermediate list
+    # of row tuples)
+    n = len(states)
+    return np.fromiter(
+        chain.from_iterable(map(_STATE_FIELDS, states)),
+        dtype=np.float64,
+        count=n * STATE_DIM,
+    ).reshape(n, STATE_DIM)
+
+
+def _normalize_states(raw: np.ndarray) -> np.ndarray:
+    """Column-wise normalization to [0, 1] (momentum -5..+5 is shifted first)"""
+    return ((raw + _STATE_OFFSET) / _STATE_SCALE).astype(np.float32)
+
 
 @dataclass
 class TrainingState:
@@ -57,6 +233,79 @@ class TrainingTransition:
     metadata: Dict = field(default_factory=dict)
 
 
+class TransitionBuffer:
+    """
+    Columnar (SoA) storage for training transitions
+    States are kept as normalized network-input rows, so building a training
+    batch is plain slicing; TrainingState objects only exist at the API boundary.
+    state_dtype=np.float16 halves state memory for buffers that are kept around
+    (inputs are in [0, 1]); they are widened to float32 when fed to the model.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        metadata: Optional[Dict] = None,
+        state_dtype: type = np.float32,
+    ):
+        self.capacity = capacity
+        # states and next_states share one contiguous arena, so the Bellman
+        # pass can score both in a single forward call (see stacked_states)
+        self._arena = np.empty((2, capacity, STATE_DIM), dtype=state_dtype)
+        self.states = self._arena[0]
+        self.next_states = self._arena[1]
+        self.actions = np.empty(capacity, dtype=np.int8)
+        self.rewards = np.empty(capacity, dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self.metadata = metadata or {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def extend(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: Optional[np.ndarray] = None,
+    ) -> None:
+        """Append a block of transitions (row-aligned arrays)"""
+        start = self.size
+        end = start + len(actions)
+        if end > self.capacity:
+            raise ValueError(
+                f"TransitionBuffer capacity {self.capacity} exceeded ({end} rows)"
+            )
+        self.states[start:end] = states
+        self.actions[start:end] = actions
+        self.rewards[start:end] = rewards
+        self.next_states[start:end] = next_states
+        if dones is not None:
+            self.dones[start:end] = dones
+        self.size = end
+
+    def stacked_states(self) -> np.ndarray:
+        """States then next states as one (2 * size, 7) block (a view when full)"""
+        return self._arena[:, : self.size].reshape(-1, STATE_DIM)
+
+    @classmethod
+    def from_transitions(
+        cls, transitions: List[TrainingTransition]
+    ) -> "TransitionBuffer":
+        """Pack TrainingTransition records into a buffer"""
+        buffer = cls(len(transitions))
+        buffer.extend(
+            PolicyTrainer.states_to_matrix([t.state for t in transitions]),
+            [t.action for t in transitions],
+            [t.reward for t in transitions],
+            PolicyTrainer.states_to_matrix([t.next_state for t in transitions]),
+            [t.done for t in transitions],
+        )
+        return buffer
+
+
 class TacticalPolicyNetwork:
     """DQN policy network for tactical recommendations"""
 
@@ -69,6 +318,12 @@ class TacticalPolicyNetwork:
         self.model = None
         self.history = {"loss": [], "val_loss": [], "accuracy": []}
         self.trained = False
+        self._optimizer = None
+        self._loss_fn = None
+        self._train_step_fn = None
+        self._train_steps_fn = None
+        self._predict_fn = None
+        self._rng = np.random.default_rng()
 
     def build_network(self, input_dim: int = 7) -> Optional["keras.Model"]:
         """
@@ -79,13 +334,11 @@ class TacticalPolicyNetwork:
         if not TF_AVAILABLE or keras is None:
             print("Warning: TensorFlow required for build_network()")
             return None
+        # Inputs arrive already normalized to [0, 1] (see states_to_matrix)
         inputs = layers.Input(shape=(input_dim,))
 
-        # Normalize inputs
-        normalized = layers.BatchNormalization()(inputs)
-
         # Dense layers with dropout
-        x = layers.Dense(128, activation="relu")(normalized)
+        x = layers.Dense(128, activation="relu")(inputs)
         x = layers.Dropout(0.3)(x)
         x = layers.Dense(64, activation="relu")(x)
         x = layers.Dropout(0.2)(x)
@@ -95,15 +348,66 @@ class TacticalPolicyNetwork:
         outputs = layers.Dense(self.ACTION_COUNT, activation="linear")(x)
 
         model = keras.Model(inputs=inputs, outputs=outputs)
+        self._optimizer = keras.optimizers.Adam(learning_rate=self.learning_rate)
+        self._loss_fn = keras.losses.MeanSquaredError()
         model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=self.learning_rate),
-            loss="mse",
-            metrics=["mae", "mse"],
+            optimizer=self._optimizer,
+            loss=self._loss_fn,
+            metrics=["mae"],
+            jit_compile=True,
         )
 
         self.model = model
+        self._trace_functions()
         return model
 
+    def _trace_functions(self) -> None:
+        """
+        Wrap the train/inference steps in tf.functions for the current model
+        Inference has an explicit (batch, input_dim) signature with an unknown
+        batch size, so every call site shares one trace. The train steps only
+        ever see a couple of shapes; reduce_retracing covers those, and a
+        fully dynamic signature measurably slows the training graph.
+        """
+        input_dim = self.model.input_shape[-1]
+        x_spec = tf.TensorSpec([None, input_dim], tf.float32)
+
+        self._train_step_fn = tf.function(self._train_step, reduce_retracing=True)
+        self._train_steps_fn = tf.function(self._train_steps, reduce_retracing=True)
+        self._predict_fn = tf.function(
+            self._predict, input_signature=[x_spec], jit_compile=True
+        )
+
+    def _predict(self, x):
+        """Inference forward pass (run through an XLA-compiled tf.function)"""
+        return self.model(x, training=False)
+
+    def q_values(self, states: np.ndarray) -> np.ndarray:
+        """Q-values for a (n, 7) batch of normalized states"""
+        if self.model is None:
+            raise RuntimeError("Model not trained. Call train() first.")
+        # C-contiguous float32 going in, so TF wraps the buffer without its own
+        # conversion copy (a no-op for TransitionBuffer rows and stacked_states)
+        x = np.ascontiguousarray(states, dtype=np.float32)
+        return self._predict_fn(x).numpy()
+
+    def _train_step(self, x, y):
+        """One optimizer step on a minibatch (run through tf.function)"""
+        with tf.GradientTape() as tape:
+            predictions = self.model(x, training=True)
+            loss = self._loss_fn(y, predictions)
+        gradients = tape.gradient(loss, self.model.trainable_variables)
+        self._optimizer.apply_gradients(zip(gradients, self.model.trainable_variables))
+        return loss
+
+    def _train_steps(self, xs, ys):
+        """Run one optimizer step per leading-axis slice of (steps, batch, dim) inputs"""
+        steps = tf.shape(xs)[0]
+        losses = tf.TensorArray(tf.float32, size=steps)
+        for i in tf.range(steps):
+            losses = losses.write(i, self._train_step(xs[i], ys[i]))
+        return losses.stack()
+
     def train_on_batch(
         self, states: np.ndarray, targets: np.ndarray, batch_size: int = 32
     ) -> float:
@@ -111,22 +415,42 @@ class TacticalPolicyNetwork:
         if self.model is None:
             self.build_network()
 
-        history = self.model.fit(
-            states,
-            targets,
-            batch_size=batch_size,
-            epochs=1,
-            verbose=0,
-            validation_split=0.2,
-        )
-
-        loss = history.history["loss"][0]
+        states = np.asarray(states, dtype=np.float32)
+        targets = np.asarray(targets, dtype=np.float32)
+
+        # One shuffled epoch of minibatch steps; validation runs separately
+        # (see evaluate) rather than on a slice of every batch
+        n = len(states)
+        order = self._rng.permutation(n)
+
+        # All full minibatches go through one traced loop (a single dispatch
+        # per episode); a short final minibatch takes one extra step call
+        full_steps = n // batch_size
+        loss_sum = 0.0
+        if full_steps:
+            idx = order[: full_steps * batch_size].reshape(full_steps, batch_size)
+            step_losses = self._train_steps_fn(states[idx], targets[idx])
+            loss_sum += float(step_losses.numpy().sum()) * batch_size
+        idx = order[full_steps * batch_size :]
+        if len(idx):
+            loss_sum += float(self._train_step_fn(states[idx], targets[idx])) * len(idx)
+
+        # Mean over samples, weighting each minibatch loss by its size
+        loss = loss_sum / n
         self.history["loss"].append(loss)
-        if "val_loss" in history.history:
-            self.history["val_loss"].append(history.history["val_loss"][0])
 
         return loss
 
+    def evaluate(self, states: np.ndarray, targets: np.ndarray) -> float:
+        """Loss on a held-out set (recorded in history["val_loss"])"""
+        if self.model is None:
+            raise RuntimeError("Model not trained. Call train() first.")
+
+        # A direct forward pass; model.evaluate would build a dataset per call
+        val_loss = float(self._loss_fn(targets, self._predict_fn(states)))
+        self.history["val_loss"].append(val_loss)
+        return val_loss
+
     def predict_action(self, state: np.ndarray) -> Tuple[int, float]:
         """
         Predict best action for a state
@@ -135,8 +459,9 @@ class TacticalPolicyNetwork:
         if self.model is None:
             raise RuntimeError("Model not trained. Call train() first.")
 
-        q_values = self.model.predict(state.reshape(1, -1), verbose=0)[0]
-        best_action = np.argmax(q_values)
+        # Direct traced forward pass; model.predict builds a data adapter per call
+        q_values = self.q_values(state.reshape(1, -1))[0]
+        best_action = int(np.argmax(q_values))
         best_q_value = q_values[best_action]
 
         return best_action, float(best_q_value)
@@ -160,78 +485,83 @@ class TacticalPolicyNetwork:
     def load(self, path: str) -> None:
         """Load model from disk"""
         self.model = keras.models.load_model(path)
+        self._optimizer = self.model.optimizer or keras.optimizers.Adam(
+            learning_rate=self.learning_rate
+        )
+        self._loss_fn = keras.losses.MeanSquaredError()
+        self._trace_functions()
         self.trained = True
 
 
 class PolicyTrainer:
     """Orchestrates policy training pipeline"""
 
+    VALIDATION_INTERVAL = 5  # episodes between held-out loss evaluations
+
     def __init__(self, policy_network: TacticalPolicyNetwork = None):
         self.policy = policy_network or TacticalPolicyNetwork()
-        self.transitions: List[TrainingTransition] = []
+        self.transitions: Optional[TransitionBuffer] = None
         self.training_started_at: float = None
         self.training_epoch: int = 0
+        self._rng = np.random.default_rng(42)
 
-    def generate_synthetic_states(self, count: int = 1000) -> List[TrainingState]:
+    def generate_synthetic_states(
+        self, count: int = 1000, rng: Optional[np.random.Generator] = None
+    ) -> List[TrainingState]:
         """
         Generate synthetic game states for training
         In practice, these would be sampled from real/simulated matches
+        rng: draw from this generator instead (the trainer's stream is untouched)
         """
-        states = []
-        np.random.seed(42)  # Deterministic for reproducibility
-
-        for _ in range(count):
-            state = TrainingState(
-                formation_id=np.random.randint(0, 4),
-                tactic_id=np.random.randint(0, 4),
-                possession_pct=np.random.uniform(30, 70),
-                team_fatigue=np.random.uniform(20, 90),
-                momentum_pmu=np.random.uniform(-3, 3),
-                opponent_formation_id=np.random.randint(0, 4),
-                opponent_tactic_id=np.random.randint(0, 4),
-                score_differential=np.random.randint(-2, 3),
-            )
-            states.append(state)
+        # Deterministic for reproducibility: by default each call restarts the
+        # trainer's stream (which generate_transitions then continues from).
+        # Every field is drawn for the whole batch in one call.
+        if rng is None:
+            rng = self._rng = np.random.default_rng(42)
+        columns = (
+            rng.integers(0, 4, count),  # formation_id
+            rng.integers(0, 4, count),  # tactic_id
+            rng.uniform(30, 70, count),  # possession_pct
+            rng.uniform(20, 90, count),  # team_fatigue
+            rng.uniform(-3, 3, count),  # momentum_pmu
+            rng.integers(0, 4, count),  # opponent_formation_id
+            rng.integers(0, 4, count),  # opponent_tactic_id
+            rng.integers(-2, 3, count),  # score_differential
+        )
 
-        return states
+        return [
+            TrainingState(*fields)
+            for fields in zip(*(column.tolist() for column in columns))
+        ]
+
+    @staticmethod
+    def states_to_matrix(states: List[TrainingState]) -> np.ndarray:
+        """Convert TrainingStates to a (n, 7) matrix of normalized input rows"""
+        return _normalize_states(_raw_state_matrix(states))
 
     def state_to_vector(self, state: TrainingState) -> np.ndarray:
         """Convert TrainingState to normalized input vector"""
-        vector = np.array(
-            [
-                state.formation_id / 3.0,  # Normalize to [0, 1]
-                state.tactic_id / 3.0,
-                state.possession_pct / 100.0,
-                state.team_fatigue / 100.0,
-                (state.momentum_pmu + 5.0) / 10.0,  # Normalize -5 to +5 → 0 to 1
-                state.opponent_formation_id / 3.0,
-                state.opponent_tactic_id / 3.0,
-            ],
-            dtype=np.float32,
-        )
-        return vector
+        return self.states_to_matrix([state])[0]
 
     def generate_transitions(
         self,
         states: List[TrainingState],
         reward_fn=None,
         use_coaching_knowledge: bool = True,
-    ) -> List[TrainingTransition]:
+        rng: Optional[np.random.Generator] = None,
+    ) -> TransitionBuffer:
         """
         Generate training transitions with assigned rewards
         reward_fn: callable(state, action) → reward value
         use_coaching_knowledge: bool - incorporate elite coach tactics
+        rng: generator for actions/perturbations (default: the trainer's stream)
         """
-        # Optionally import coaching knowledge
+        # Optionally use coaching knowledge
         coaching_knowledge = None
         if use_coaching_knowledge:
-            try:
-                from coaching.coaching_knowledge import (
-                    get_coach_recommendations_for_state,
-                )
-
+            if COACHING_AVAILABLE:
                 coaching_knowledge = get_coach_recommendations_for_state
-            except ImportError:
+            else:
                 print(
                     "Warning: Coaching knowledge not available. Training without coach insights."
                 )
@@ -266,124 +596,84 @@ class PolicyTrainer:
 
                     # Top 3 coaches recommended, reward alignment with their profiles
                     if coach_recs and len(coach_recs) >= 3:
-                        top_coaches = [c[0] for c in coach_recs[:3]]
-                        # Get coach preference scores
-                        try:
-                            from coaching.coaching_knowledge import (
-                                get_coach_tactical_profile,
-                            )
-
-                            coach_bonus = 0.0
-                            for coach_name in top_coaches:
-                                coach = get_coach_tactical_profile(coach_name)
-                                if coach:
-                                    # Reward actions that align with top coaches
-                                    if (
-                                        tactic_id == 1
-                                        and coach.pressing_intensity > 0.7
-                                    ):
-                                        coach_bonus += 0.05
-                                    elif (
-                                        tactic_id == 3
-                                        and coach.possession_preference > 0.7
-                                    ):
-                                        coach_bonus += 0.05
-                                    elif (
-                                        tactic_id == 0
-                                        and 0.4 < coach.pressing_intensity < 0.7
-                                    ):
-                                        coach_bonus += 0.03
-
-                            reward += (
-                                coach_bonus / len(top_coaches) if top_coaches else 0
-                            )
-                        except Exception:
-                            pass  # Silently ignore coaching bonus if unavailable
+                        coach_bonus = 0.0
+                        for coach_name, _ in coach_recs[:3]:
+                            coach_bonus += _coach_tactic_bonus(coach_name)[tactic_id]
+                        reward += coach_bonus / 3
 
                 return reward
 
             reward_fn = coaching_reward
 
-        transitions = []
-        for i, state in enumerate(states):
-            # Sample random action
-            action = np.random.randint(0, self.policy.ACTION_COUNT)
-            reward = reward_fn(state, action)
-
-            # Generate next state (simple: slight modifications)
-            next_state = TrainingState(
-                formation_id=np.random.randint(0, 4),
-                tactic_id=np.random.randint(0, 4),
-                possession_pct=max(
-                    30, min(70, state.possession_pct + np.random.uniform(-5, 5))
-                ),
-                team_fatigue=max(
-                    20, min(90, state.team_fatigue + np.random.uniform(-2, 2))
-                ),
-                momentum_pmu=max(
-                    -3, min(3, state.momentum_pmu + np.random.uniform(-0.5, 0.5))
-                ),
-                opponent_formation_id=state.opponent_formation_id,
-                opponent_tactic_id=state.opponent_tactic_id,
-                score_differential=state.score_differential,
-            )
+        # Random actions and next-state perturbations, drawn for all states at once
+        n = len(states)
+        if rng is None:
+            rng = self._rng
+        actions = rng.integers(0, self.policy.ACTION_COUNT, n)
+        next_formations = rng.integers(0, 4, n)
+        next_tactics = rng.integers(0, 4, n)
+        possession_noise = rng.uniform(-5, 5, n)
+        fatigue_noise = rng.uniform(-2, 2, n)
+        momentum_noise = rng.uniform(-0.5, 0.5, n)
+
+        rewards = np.fromiter(
+            map(reward_fn, states, actions.tolist()), dtype=np.float32, count=n
+        )
 
-            transition = TrainingTransition(
-                state=state,
-                action=action,
-                reward=reward,
-                next_state=next_state,
-                done=False,
-                metadata={
-                    "source": "coaching_enhanced" if use_coaching_knowledge else "base",
-                    "coach_informed": coaching_knowledge is not None,
-                },
-            )
-            transitions.append(transition)
+        # Next state (simple: slight modifications, clipped to the sampled
+        # ranges); the opponent setup is kept
+        raw = _raw_state_matrix(states)
+        next_raw = raw.copy()
+        next_raw[:, 0] = next_formations
+        next_raw[:, 1] = next_tactics
+        np.clip(raw[:, 2] + possession_noise, 30, 70, out=next_raw[:, 2])
+        np.clip(raw[:, 3] + fatigue_noise, 20, 90, out=next_raw[:, 3])
+        np.clip(raw[:, 4] + momentum_noise, -3, 3, out=next_raw[:, 4])
+
+        transitions = TransitionBuffer(
+            n,
+            metadata={
+                "source": "coaching_enhanced" if use_coaching_knowledge else "base",
+                "coach_informed": coaching_knowledge is not None,
+            },
+        )
+        transitions.extend(
+            _normalize_states(raw), actions, rewards, _normalize_states(next_raw)
+        )
 
         self.transitions = transitions
         return transitions
 
     def prepare_training_data(
-        self, transitions: List[TrainingTransition], gamma: float = 0.99
+        self,
+        transitions: Union[TransitionBuffer, List[TrainingTransition]],
+        gamma: float = 0.99,
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Prepare training data (states → Q-targets)
         Gamma: discount factor
         """
-        states = []
-        q_targets = []
-
-        for transition in transitions:
-            state_vec = self.state_to_vector(transition.state)
-            next_state_vec = self.state_to_vector(transition.next_state)
-
-            # Q-target = reward + gamma * max(Q(next_state))
-            if self.policy.model is not None:
-                next_q_values = self.policy.model.predict(
-                    next_state_vec.reshape(1, -1), verbose=0
-                )[0]
-                next_max_q = np.max(next_q_values)
-            else:
-                next_max_q = 0
-
-            q_target = transition.reward + gamma * next_max_q
-
-            # Build full Q-target vector (zeros except for taken action)
-            if self.policy.model is not None:
-                current_q = self.policy.model.predict(
-                    state_vec.reshape(1, -1), verbose=0
-                )[0]
-                q_target_vec = current_q.copy()
-            else:
-                q_target_vec = np.zeros(self.policy.ACTION_COUNT)
-
-            q_target_vec[transition.action] = q_target
+        if not isinstance(transitions, TransitionBuffer):
+            transitions = TransitionBuffer.from_transitions(transitions)
+        n = len(transitions)
+        states = np.ascontiguousarray(transitions.states[:n], dtype=np.float32)
+        actions = transitions.actions[:n]
+        rewards = transitions.rewards[:n]
+
+        # Q-target = reward + gamma * max(Q(next_state)), with current Q-values
+        # for the actions not taken. States and next states go through one
+        # batched forward pass instead of two predict() calls per transition.
+        if self.policy.model is not None and n:
+            q_all = self.policy.q_values(transitions.stacked_states())
+            q_targets = q_all[:n]
+            next_max_q = q_all[n:].max(axis=1)
+        else:
+            next_max_q = np.zeros(n, dtype=np.float32)
+            q_targets = np.zeros((n, self.policy.ACTION_COUNT), dtype=np.float32)
 
-            states.append(state_vec)
-            q_targets.append(q_target_vec)
+        q_targets[np.arange(n), actions] = rewards + gamma * next_max_q
 
-        return np.array(states, dtype=np.float32), np.array(q_targets, dtype=np.float32)
+        return states, q_targets
 
     def train(
         self, num_episodes: int = 10, states_per_episode: int = 100
@@ -412,7 +702,24 @@ class PolicyTrainer:
         self.training_started_at = time.time()
         self.policy.build_network()
 
-        metrics = {"episodes": [], "avg_loss": [], "total_transitions": 0}
+        metrics = {
+            "episodes": [],
+            "avg_loss": [],
+            "val_loss": [],
+            "total_transitions": 0,
+        }
+
+        # Fixed validation transitions (20% of an episode), scored every
+        # VALIDATION_INTERVAL episodes and after the last one. They come from
+        # their own seed: every episode restarts the seed-42 training stream,
+        # so drawing them from it would repeat the training data.
+        val_rng = np.random.default_rng(43)
+        val_transitions = self.generate_transitions(
+            self.generate_synthetic_states(
+                max(1, states_per_episode // 5), rng=val_rng
+            ),
+            rng=val_rng,
+        )
 
         for episode in range(num_episodes):
             # Generate new states
@@ -429,6 +736,14 @@ class PolicyTrainer:
             metrics["avg_loss"].append(float(loss))
             metrics["total_transitions"] += len(transitions)
 
+            if (episode + 1) % self.VALIDATION_INTERVAL == 0 or (
+                episode + 1 == num_episodes
+            ):
+                val_states, val_targets = self.prepare_training_data(val_transitions)
+                metrics["val_loss"].append(
+                    self.policy.evaluate(val_states, val_targets)
+                )
+
             self.training_epoch = episode + 1
 
         self.policy.trained = True
@@ -464,12 +779,7 @@ class PolicyTrainer:
         advanced_analysis = self._compute_advanced_analysis(state, action_details)
         reasoning = self._generate_reasoning(state, action_details, reasoning_base)
 
-        try:
-            from coaching.coaching_knowledge import (
-                get_coach_recommendations_for_state,
-                get_coach_tactical_profile,
-            )
-
+        if COACHING_AVAILABLE:
             coach_recs = get_coach_recommendations_for_state(
                 possession=state.possession_pct,
                 fatigue=state.team_fatigue,
@@ -501,8 +811,6 @@ class PolicyTrainer:
                     f"{state.possession_pct:.1f}% possession, {state.team_fatigue:.1f}% fatigue, "
                     f"{state.momentum_pmu:+.1f} momentum."
                 )
-        except ImportError:
-            pass  # Coaching knowledge not available
 
         return {
             "action_id": action_details["action_id"],
@@ -531,102 +839,15 @@ class PolicyTrainer:
         Advanced heuristic recommendation system for when neural network is unavailable
         Returns: (action_id, q_value_estimate, confidence)
         """
-        scores = np.zeros(self.policy.ACTION_COUNT)
-
-        for action_id in range(self.policy.ACTION_COUNT):
-            formation_id = action_id // len(self.policy.TACTICS)
-            tactic_id = action_id % len(self.policy.TACTICS)
-
-            score = 0.0
-
-            # === POSSESSION-BASED TACTICS ===
-            if state.possession_pct > 60:  # High possession
-                if tactic_id == 3:  # possession tactic
-                    score += 0.4
-                if tactic_id == 1:  # aggressive_press when ahead
-                    score += 0.3
-                if formation_id == 0:  # 4-3-3 (possession-friendly)
-                    score += 0.2
-            elif state.possession_pct < 40:  # Low possession
-                if tactic_id == 2:  # deep_defense
-                    score += 0.4
-                if formation_id == 3:  # 5-3-2 (defensive)
-                    score += 0.3
-            else:  # Balanced possession
-                if tactic_id == 0:  # balanced
-                    score += 0.3
-                if formation_id == 1:  # 4-2-3-1 (balanced)
-                    score += 0.2
-
-            # === FATIGUE MANAGEMENT ===
-            if state.team_fatigue > 75:
-                if (
-                    tactic_id == 0 or tactic_id == 2
-                ):  # balanced or defensive (less intensive)
-                    score += 0.3
-                else:
-                    score -= 0.2  # Avoid aggressive tactics when fatigued
-            elif state.team_fatigue < 40:
-                if (
-                    tactic_id == 1 or tactic_id == 3
-                ):  # pressing or possession (more intensive)
-                    score += 0.3
-
-            # === MOMENTUM DYNAMICS ===
-            # When we have momentum, be aggressive
-            if state.momentum_pmu > 1.0:
-                if tactic_id == 1:  # aggressive_press
-                    score += 0.4
-                if tactic_id == 3:  # possession - maintain control
-                    score += 0.2
-            # When momentum is against us, stabilize
-            elif state.momentum_pmu < -1.0:
-                if tactic_id == 2:  # deep_defense - absorb pressure
-                    score += 0.4
-                if tactic_id == 0:  # balanced
-                    score += 0.2
-
-            # === SCORE DIFFERENTIAL ===
-            if state.score_differential > 0:  # Winning
-                if tactic_id == 2:  # deep_defense - protect lead
-                    score += 0.3
-                if tactic_id == 0:  # balanced - maintain
-                    score += 0.2
-            elif state.score_differential < 0:  # Losing
-                if tactic_id == 1:  # aggressive_press - create chances
-                    score += 0.35
-                if tactic_id == 3:  # possession - control game
-                    score += 0.25
-
-            # === OPPONENT FORMATION MATCHING ===
-            # Counter-formation advantage (simplified)
-            if state.opponent_formation_id == formation_id:
-                score += 0.1  # Same formation can indicate familiarity
-
-            # === BASE TACTIC VIABILITY ===
-            # tactic_id values affect base score differently
-            base_tactic_bonus = [0.1, 0.15, 0.12, 0.2][
-                tactic_id
-            ]  # possession (id=3) slightly favored
-            score += base_tactic_bonus
-
-            scores[action_id] = score
-
-        # Get best action
-        best_action = int(np.argmax(scores))
-        best_score = float(scores[best_action])
-
-        # Normalize score to confidence (0-1 range)
-        confidence = float(
-            np.clip(
-                (best_score - np.min(scores)) / (np.max(scores) - np.min(scores) + 0.1),
-                0.0,
-                1.0,
-            )
+        opponent = state.opponent_formation_id
+        return _heuristic_recommendation(
+            _band(state.possession_pct, 40, 60),
+            _band(state.team_fatigue, 40, 75),
+            _band(state.momentum_pmu, -1.0, 1.0),
+            _band(state.score_differential, 0, 0),
+            int(opponent) if opponent in _OPPONENT_FORMATIONS else -1,
         )
 
-        return best_action, best_score, confidence
-
     def _compute_advanced_analysis(
         self, state: TrainingState, action_details: Dict[str, str]
     ) -> Dict[str, Any]:
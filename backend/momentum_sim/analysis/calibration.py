@@ -3,10 +3,97 @@ backend/momentum_sim/analysis/calibration.py
 Model calibration and validation pipeline
 """
 
+import heapq
 import json
+import os
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from statistics import correlation, mean
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+
+def _read_json(path) -> Any:
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    if not ORJSON_AVAILABLE:
+        with open(path, "r") as f:
+            return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _parse_match_file(path: str, mtime_ns: int, size: int) -> Tuple[Dict, ...]:
+    """Parse a match file; (mtime_ns, size) key the cache so edits re-parse."""
+    if Path(path).suffix != ".jsonl":
+        return tuple(_read_json(path))
+    if not ORJSON_AVAILABLE:
+        with open(path, "r") as f:
+            return tuple(json.loads(line) for line in f if line.strip())
+    lines = Path(path).read_bytes().splitlines()
+    return tuple(orjson.loads(line) for line in lines if line.strip())
+
+
+# Bump when the baseline OLS features or clamps change, so saved coefficients
+# from an older fit are not reused
+_COEF_SIDECAR_VERSION = 1
+
+
+def _coef_sidecar_paths(data_path: str) -> Tuple[Path, Path]:
+    """Coefficient (.coef.npy) and metadata (.coef.json) files next to a dataset."""
+    path = Path(data_path)
+    return (
+        path.with_name(f"{path.stem}.coef.npy"),
+        path.with_name(f"{path.stem}.coef.json"),
+    )
+
+
+def _dataset_key(data_path: str) -> Dict[str, int]:
+    """Identify a dataset version by size and mtime, like the parse cache."""
+    st = os.stat(data_path)
+    return {
+        "version": _COEF_SIDECAR_VERSION,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def _load_saved_coef(data_path: str, key: Dict[str, int]) -> Optional[np.ndarray]:
+    """Coefficients saved for this exact dataset version, or None."""
+    coef_path, meta_path = _coef_sidecar_paths(data_path)
+    try:
+        if json.loads(meta_path.read_text()) != key:
+            return None
+        coef = np.load(coef_path)
+    except (OSError, ValueError):
+        return None
+    return coef if coef.shape == (5,) else None
+
+
+def _save_coef(data_path: str, key: Dict[str, int], coef: np.ndarray) -> None:
+    """Persist fitted coefficients next to the dataset (best effort)."""
+    coef_path, meta_path = _coef_sidecar_paths(data_path)
+    try:
+        np.save(coef_path, coef)
+        meta_path.write_text(json.dumps(key))
+    except OSError:
+        pass
 
 
 class CalibrationValidator:
@@ -17,13 +104,16 @@ class CalibrationValidator:
         self.predictions = []
 
     def load_matches(self, file_path: str) -> List[Dict]:
-        """Load match data from JSON file."""
-        if not Path(file_path).exists():
-            raise FileNotFoundError(f"Match file not found: {file_path}")
-
-        with open(file_path, "r") as f:
-            self.matches = json.load(f)
-
+        """Load match data from a JSON array or JSON Lines (.jsonl) file."""
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Match file not found: {file_path}") from None
+
+        # Unchanged files are served from the parse cache
+        self.matches = list(
+            _parse_match_file(str(file_path), st.st_mtime_ns, st.st_size)
+        )
         return self.matches
 
     def calculate_r_squared(self, actual: List[float], predicted: List[float]) -> float:
@@ -39,10 +129,12 @@ class CalibrationValidator:
         if len(actual) != len(predicted) or len(actual) < 2:
             return 0.0
 
-        actual_mean = mean(actual)
+        a = np.asarray(actual, dtype=np.float64)
+        residuals = a - np.asarray(predicted, dtype=np.float64)
+        deviations = a - a.mean()
 
-        ss_res = sum((a - p) ** 2 for a, p in zip(actual, predicted))
-        ss_tot = sum((a - actual_mean) ** 2 for a in actual)
+        ss_res = float(residuals @ residuals)
+        ss_tot = float(deviations @ deviations)
 
         if ss_tot == 0:
             return 0.0
@@ -59,14 +151,12 @@ class CalibrationValidator:
         if len(actual) != len(predicted) or len(actual) == 0:
             return 0.0
 
-        errors = []
-        for a, p in zip(actual, predicted):
-            if a != 0:
-                errors.append(abs(a - p) / abs(a))
-            else:
-                errors.append(0)
+        a = np.asarray(actual, dtype=np.float64)
+        abs_errors = np.abs(a - np.asarray(predicted, dtype=np.float64))
+        # Zero actuals contribute an error of 0
+        errors = np.divide(abs_errors, np.abs(a), out=np.zeros_like(a), where=a != 0)
 
-        return mean(errors) if errors else 0.0
+        return float(errors.mean())
 
     def validate_xg_prediction(self, match: Dict, predicted_xg: float) -> Dict:
         """
@@ -140,28 +230,51 @@ class CalibrationValidator:
                 "message": "No valid matches in test set",
             }
 
-        # Calculate metrics
-        r_squared = self.calculate_r_squared(actual_xg_list, predicted_xg_list)
-        mape = self.calculate_mape(actual_xg_list, predicted_xg_list)
-
-        # Correlation analysis
-        try:
-            if len(set(actual_xg_list)) > 1 and len(set(predicted_xg_list)) > 1:
-                corr = correlation(actual_xg_list, predicted_xg_list)
-            else:
-                corr = 1.0
-        except Exception:
+        # Calculate metrics: R², MAPE, correlation and bias all come from the
+        # residuals and the deviations from each mean, computed once
+        actual = np.asarray(actual_xg_list, dtype=np.float64)
+        predicted = np.asarray(predicted_xg_list, dtype=np.float64)
+        residuals = actual - predicted
+        mean_actual = actual.mean()
+        mean_predicted = predicted.mean()
+        actual_dev = actual - mean_actual
+        predicted_dev = predicted - mean_predicted
+
+        ss_res = float(residuals @ residuals)
+        ss_tot = float(actual_dev @ actual_dev)
+        ss_pred = float(predicted_dev @ predicted_dev)
+
+        # Same guards and clamping as calculate_r_squared / calculate_mape
+        if len(actual) < 2 or ss_tot == 0:
+            r_squared = 0.0
+        else:
+            r_squared = max(0.0, min(1.0, 1 - (ss_res / ss_tot)))
+        abs_actual = np.abs(actual)
+        mape = float(
+            np.divide(
+                np.abs(residuals),
+                abs_actual,
+                out=np.zeros_like(actual),
+                where=abs_actual != 0,
+            ).mean()
+        )
+
+        # Correlation analysis (1.0 when either side is constant)
+        if np.ptp(actual) > 0 and np.ptp(predicted) > 0:
+            cov = float(actual_dev @ predicted_dev)
+            corr = max(-1.0, min(1.0, cov / (ss_tot * ss_pred) ** 0.5))
+        else:
             corr = 1.0
 
         # Bias analysis
-        mean_actual = mean(actual_xg_list)
-        mean_predicted = mean(predicted_xg_list)
-        bias = mean_predicted - mean_actual
+        bias = float(mean_predicted - mean_actual)
 
-        # Get best and worst predictions
-        sorted_results = sorted(match_results, key=lambda x: x["error"])
-        best_predictions = sorted_results[:3]
-        worst_predictions = sorted_results[-3:]
+        # Get best and worst predictions (top-3 selection instead of a full
+        # sort). Worst is scanned in reverse and flipped back so ties and
+        # ordering match the last three of an ascending sort.
+        error = itemgetter("error")
+        best_predictions = heapq.nsmallest(3, match_results, key=error)
+        worst_predictions = heapq.nlargest(3, reversed(match_results), key=error)[::-1]
 
         return {
             "status": "success",
@@ -171,7 +284,9 @@ class CalibrationValidator:
                 "mape": round(mape, 4),
                 "correlation": round(corr, 4),
                 "bias": round(bias, 4),
-                "mean_error": round(mean([r["error"] for r in match_results]), 3),
+                "mean_error": round(
+                    float(np.mean([r["error"] for r in match_results])), 3
+                ),
             },
             "thresholds": {
                 "r_squared_target": 0.70,
@@ -186,7 +301,7 @@ class CalibrationValidator:
         }
 
 
-def create_simple_xg_predictor():
+def create_simple_xg_predictor(streaming: bool = False):
     """
     Create a simple xG predictor based on match characteristics.
 
@@ -194,115 +309,147 @@ def create_simple_xg_predictor():
     (so CI calibration can validate model changes reliably). The predictor
     mirrors the deterministic part of the generator and predicts the
     expected xG (i.e. mean of the generator noise), not a noisy sample.
-    """
 
-    def predict_xg(match: Dict) -> float:
-        """Predict xG for Team A based on match characteristics.
+    Args:
+        streaming: Stream the synthetic dataset with ijson while fitting, so
+                   only the feature columns are held in memory (for very large
+                   datasets; slower than the default parser on small files)
+    """
 
-        Mirrors synthetic_dataset.SyntheticDatasetGenerator.generate_match()
-        deterministic core:
-          xg_a_raw = base_xg * tactic_mult_a * coherence_a * (1.0 - coherence_b * 0.1)
+    # Base xG (league average used by generator)
+    base_xg = 0.035
+
+    # Formation coherence (same mapping as generator)
+    formation_coherence = {
+        "4-3-3": 0.87,
+        "4-4-2": 0.84,
+        "3-5-2": 0.85,
+        "5-3-2": 0.86,
+        "4-2-4": 0.80,
+    }
+
+    # Tactic multiplier (same mapping as generator)
+    tactic_mult = {
+        "aggressive": 1.20,
+        "balanced": 1.00,
+        "defensive": 0.75,
+        "possession": 0.95,
+    }
+
+    # Small integer codes into float lookup tables, so the fit gathers
+    # coherences/multipliers with one array index per column. The extra last
+    # slot holds the default for names missing from the maps.
+    formation_codes = {name: code for code, name in enumerate(formation_coherence)}
+    coherence_table = np.array([*formation_coherence.values(), 0.85])
+    tactic_codes = {name: code for code, name in enumerate(tactic_mult)}
+    tactic_table = np.array([*tactic_mult.values(), 1.0])
+
+    def raw_prediction(match: Dict) -> float:
+        """Deterministic core of synthetic_dataset.SyntheticDatasetGenerator.generate_match():
+        xg_a_raw = base_xg * tactic_mult_a * coherence_a * (1.0 - coherence_b * 0.1)
         """
+        coherence_a = formation_coherence.get(match.get("formation_a", "4-3-3"), 0.85)
+        coherence_b = formation_coherence.get(match.get("formation_b", "4-3-3"), 0.85)
+        multip = tactic_mult.get(match.get("tactic_a", "balanced"), 1.0)
+        return base_xg * multip * coherence_a * (1.0 - coherence_b * 0.1)
+
+    def feature_matrix(matches) -> Tuple[np.ndarray, np.ndarray]:
+        """OLS design [1, raw_pred, shot_count_a, possession_a, passes_a] and xG targets"""
+        # One pass over the records collects plain columns; raw_pred is then
+        # computed for all matches at once (same formula as raw_prediction)
+        unknown_formation = len(formation_codes)
+        unknown_tactic = len(tactic_codes)
+        tactic_a, formation_a, formation_b = [], [], []
+        shots, poss, passes, ys = [], [], [], []
+        for m in matches:
+            tactic_a.append(
+                tactic_codes.get(m.get("tactic_a", "balanced"), unknown_tactic)
+            )
+            formation_a.append(
+                formation_codes.get(m.get("formation_a", "4-3-3"), unknown_formation)
+            )
+            formation_b.append(
+                formation_codes.get(m.get("formation_b", "4-3-3"), unknown_formation)
+            )
+            shots.append(float(m.get("shot_count_a", 0)))
+            poss.append(float(m.get("possession_a", 50.0)))
+            passes.append(float(m.get("passes_a", 0)))
+            ys.append(m.get("xg_a", 0.0))
+
+        raw_pred = (
+            base_xg
+            * tactic_table[np.array(tactic_a, dtype=np.uint8)]
+            * coherence_table[np.array(formation_a, dtype=np.uint8)]
+            * (1.0 - coherence_table[np.array(formation_b, dtype=np.uint8)] * 0.1)
+        )
+        # Intercept column included, so the design matrix is built in one copy
+        X = np.column_stack((np.ones_like(raw_pred), raw_pred, shots, poss, passes))
+        return X, np.array(ys)
+
+    # If the synthetic dataset exists, fit a small OLS model using
+    # readily available match stats (shots, possession, passes). This
+    # produces a much stronger baseline for CI calibration checks. The fit
+    # runs once here, so each prediction is just a dot product.
+    if streaming and not IJSON_AVAILABLE:
+        print("Warning: ijson not installed, loading dataset without streaming")
+        streaming = False
+
+    coef = None
+    try:
+        data_path = None
+        for p in (
+            "backend/data/synthetic_matches.json",
+            "data/synthetic_matches.json",
+        ):
+            if Path(p).exists():
+                data_path = p
+                break
+
+        if data_path:
+            # Coefficients only depend on the dataset, so reuse the ones saved
+            # by an earlier fit of the same file
+            key = _dataset_key(data_path)
+            coef = _load_saved_coef(data_path, key)
+
+        if data_path and coef is None:
+            if streaming:
+                with open(data_path, "rb") as fh:
+                    X, y = feature_matrix(ijson.items(fh, "item", use_float=True))
+            else:
+                X, y = feature_matrix(_read_json(data_path))
+
+            if len(X) >= 10:
+                coef, *_ = np.linalg.lstsq(X, y, rcond=None)
+                # clamp coefficients to stable, sensible ranges (intercept, raw, shots, possession, passes)
+                low = np.array([-0.05, 0.2, 0.0001, -0.005, -0.0005])
+                high = np.array([0.05, 1.5, 0.01, 0.005, 0.0005])
+                coef = np.clip(coef, low, high)
+                _save_coef(data_path, key, coef)
+    except Exception:
+        # fall back to deterministic calibration in predict_xg
+        coef = None
 
-        # Base xG (league average used by generator)
-        base_xg = 0.035
-
-        # Formation coherence (same mapping as generator)
-        formation_coherence = {
-            "4-3-3": 0.87,
-            "4-4-2": 0.84,
-            "3-5-2": 0.85,
-            "5-3-2": 0.86,
-            "4-2-4": 0.80,
-        }
-        formation_a = match.get("formation_a", "4-3-3")
-        formation_b = match.get("formation_b", "4-3-3")
-        coherence_a = formation_coherence.get(formation_a, 0.85)
-        coherence_b = formation_coherence.get(formation_b, 0.85)
-
-        # Tactic multiplier (same mapping as generator)
-        tactic_mult = {
-            "aggressive": 1.20,
-            "balanced": 1.00,
-            "defensive": 0.75,
-            "possession": 0.95,
-        }
-        tactic_a = match.get("tactic_a", "balanced")
-        multip = tactic_mult.get(tactic_a, 1.0)
-
-        # Use the deterministic formula from the generator (expected value)
-        raw_pred = base_xg * multip * coherence_a * (1.0 - coherence_b * 0.1)
+    def predict_xg(match: Dict) -> float:
+        """Predict xG for Team A based on match characteristics."""
+        raw_pred = raw_prediction(match)
 
-        # If the synthetic dataset exists, fit a small OLS model using
-        # readily available match stats (shots, possession, passes). This
-        # produces a much stronger baseline for CI calibration checks
-        # (the model trains quickly on the local synthetic file only).
-        try:
-            data_path = None
-            for p in (
-                "backend/data/synthetic_matches.json",
-                "data/synthetic_matches.json",
-            ):
-                if Path(p).exists():
-                    data_path = p
-                    break
-
-            if data_path:
-                with open(data_path, "r") as fh:
-                    sample_matches = json.load(fh)
-
-                # build feature matrix: [raw_pred, shot_count_a, possession_a, passes_a]
-                rows = []
-                ys = []
-                for m in sample_matches:
-                    rp = (
-                        base_xg
-                        * tactic_mult.get(m.get("tactic_a", "balanced"), 1.0)
-                        * formation_coherence.get(m.get("formation_a", "4-3-3"), 0.85)
-                        * (
-                            1.0
-                            - formation_coherence.get(
-                                m.get("formation_b", "4-3-3"), 0.85
-                            )
-                            * 0.1
-                        )
-                    )
-                    shots = float(m.get("shot_count_a", 0))
-                    poss = float(m.get("possession_a", 50.0))
-                    passes = float(m.get("passes_a", 0))
-                    rows.append([rp, shots, poss, passes])
-                    ys.append(m.get("xg_a", 0.0))
-
-                if len(rows) >= 10:
-                    import numpy as _np
-
-                    X = _np.array(rows)
-                    y = _np.array(ys)
-                    # prepend ones for intercept
-                    Xb = _np.hstack([_np.ones((X.shape[0], 1)), X])
-                    coef, *_ = _np.linalg.lstsq(Xb, y, rcond=None)
-                    # clamp coefficients to stable, sensible ranges (intercept, raw, shots, possession, passes)
-                    low = _np.array([-0.05, 0.2, 0.0001, -0.005, -0.0005])
-                    high = _np.array([0.05, 1.5, 0.01, 0.005, 0.0005])
-                    coef = _np.clip(coef, low, high)
-
-                    # apply learned linear model to current match
-                    feat = _np.array(
-                        [
-                            1.0,
-                            raw_pred,
-                            float(match.get("shot_count_a", 0)),
-                            float(match.get("possession_a", 50.0)),
-                            float(match.get("passes_a", 0)),
-                        ]
-                    )
-                    predicted_xg = float(_np.dot(coef, feat))
-                    # small stabilizing scale
-                    predicted_xg *= 1.0
-                    return min(0.3, max(0.01, round(predicted_xg, 4)))
-        except Exception:
-            # fallback to deterministic calibration below
-            pass
+        if coef is not None:
+            try:
+                # apply learned linear model to current match
+                feat = np.array(
+                    [
+                        1.0,
+                        raw_pred,
+                        float(match.get("shot_count_a", 0)),
+                        float(match.get("possession_a", 50.0)),
+                        float(match.get("passes_a", 0)),
+                    ]
+                )
+                predicted_xg = float(np.dot(coef, feat))
+                return min(0.3, max(0.01, round(predicted_xg, 4)))
+            except Exception:
+                # fallback to deterministic calibration below
+                pass
 
         # Fallback deterministic calibration (small bias scale)
         bias_scale = 1.01
@@ -310,5 +457,3 @@ def create_simple_xg_predictor():
         return min(0.3, max(0.01, predicted_xg))  # round for stability
 
     return predict_xg
-
-    return predict_xg
@@ -16,14 +16,16 @@ micro-momentum reveals:
 This is where games are actually won/lost at a tactical level.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 from datetime import datetime
 import math
-import statistics
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class MicroMomentumSnapshot:
     """
     Single snapshot of game state in a 10-30 second window.
@@ -61,7 +63,7 @@ class MicroMomentumSnapshot:
     tactical_phase: str = "buildup"  # 'buildup', 'final_third', 'defensive',  'recovery'
 
 
-@dataclass
+@dataclass(slots=True)
 class MicroMomentumEvent:
     """
     Significant momentum event within a 30-second window.
@@ -76,6 +78,21 @@ class MicroMomentumEvent:
     is_game_changing: bool = False  # Did this shift momentum meaningfully?
 
 
+# Numeric fields of each recorded event, for vectorised counts and filters
+EVENT_TYPES = ('momentum_peak', 'momentum_trough', 'inflection', 'burst', 'collapse')
+TEAM_IDS = ('A', 'B')
+_EVENT_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+_TEAM_CODES = {team_id: code for code, team_id in enumerate(TEAM_IDS)}
+_EVENT_DTYPE = np.dtype([
+    ('timestamp', np.int64),
+    ('kind', np.int8),  # Index into EVENT_TYPES
+    ('team', np.int8),  # Index into TEAM_IDS
+    ('magnitude', np.float64),
+    ('impact', np.float64),
+    ('is_game_changing', np.bool_),
+])
+
+
 class MicroMomentumEngine:
     """
     Analyze game momentum at ultra-granular resolution.
@@ -97,57 +114,140 @@ class MicroMomentumEngine:
     PRESSURE_RECOVERY_BASELINE = 20.0  # meters, normal defensive distance
     PRESSURE_SPIKE_THRESHOLD = 8.0  # Within 8m = high pressure
     
+    # Snapshot fields mirrored into the column store: column -> (attribute, dtype)
+    _COLUMNS = {
+        'ts': ('timestamp', np.int64),
+        'mom_a': ('team_a_momentum_score', np.float64),
+        'mom_b': ('team_b_momentum_score', np.float64),
+        'press_a': ('team_a_pressure', np.float64),
+        'press_b': ('team_b_pressure', np.float64),
+        'shift_rate': ('momentum_shift_rate', np.float64),
+        'possession': ('possession_percentage', np.float64),
+    }
+    
     def __init__(self, match_duration_seconds: int = 5400):  # 90 minutes
         self.match_duration = match_duration_seconds
         self.snapshots: List[MicroMomentumSnapshot] = []
         self.events: List[MicroMomentumEvent] = []
-        self.momentum_history: Dict[str, List[float]] = {'A': [], 'B': []}
+        self.momentum_history: Dict[str, Deque[float]] = {'A': deque(), 'B': deque()}
+        
+        # Columnar copy of the fields the analytics read, so they scan
+        # contiguous arrays instead of calling getattr on every snapshot.
+        # Sized for one snapshot per 10 seconds and doubled when full.
+        capacity = max(1, match_duration_seconds // 10)
+        self._n = 0
+        self._cols: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, (_, dtype) in self._COLUMNS.items()
+        }
+        
+        # Structured copy of self.events. Rows are buffered as tuples and
+        # written into the array in one batch when the log is next read.
+        self._n_events = 0
+        self._event_log = np.empty(1024, dtype=_EVENT_DTYPE)
+        self._pending_events: List[Tuple] = []
     
     def add_snapshot(self, snapshot: MicroMomentumSnapshot):
         """Record a micro-momentum snapshot."""
         self.snapshots.append(snapshot)
-        self.momentum_history[snapshot.team_a_momentum_score].append(snapshot.team_a_momentum_score)
-        self.momentum_history[snapshot.team_b_momentum_score].append(snapshot.team_b_momentum_score)
+        self._append_columns(snapshot)
+        self.momentum_history['A'].append(snapshot.team_a_momentum_score)
+        self.momentum_history['B'].append(snapshot.team_b_momentum_score)
         
         # Check for significant events
         self._detect_events(snapshot)
     
+    def _append_columns(self, snapshot: MicroMomentumSnapshot):
+        """Write a snapshot's fields into the column store."""
+        if self._n == len(self._cols['ts']):
+            for name, col in self._cols.items():
+                grown = np.empty(2 * len(col), dtype=col.dtype)
+                grown[:self._n] = col
+                self._cols[name] = grown
+        
+        for name, (attr, _) in self._COLUMNS.items():
+            self._cols[name][self._n] = getattr(snapshot, attr)
+        self._n += 1
+    
+    def _column(self, name: str) -> np.ndarray:
+        """View of a column trimmed to the recorded snapshots."""
+        return self._cols[name][:self._n]
+    
+    def _record_event(self, event: MicroMomentumEvent):
+        """Append an event to self.events and queue it for the event log."""
+        self.events.append(event)
+        self._pending_events.append((
+            event.timestamp,
+            _EVENT_CODES[event.event_type],
+            _TEAM_CODES[event.team_id],
+            event.magnitude,
+            event.impact,
+            event.is_game_changing,
+        ))
+    
+    def _recorded_events(self) -> np.ndarray:
+        """View of the event log trimmed to the recorded events."""
+        if self._pending_events:
+            batch = np.array(self._pending_events, dtype=_EVENT_DTYPE)
+            self._pending_events.clear()
+            
+            size = self._n_events + len(batch)
+            if size > len(self._event_log):
+                grown = np.empty(max(size, 2 * len(self._event_log)), dtype=_EVENT_DTYPE)
+                grown[:self._n_events] = self._event_log[:self._n_events]
+                self._event_log = grown
+            
+            self._event_log[self._n_events:size] = batch
+            self._n_events = size
+        
+        return self._event_log[:self._n_events]
+    
+    def _count_events(self, event_type: str, team_id: str) -> int:
+        """Number of recorded events of a type for a team."""
+        events = self._recorded_events()
+        matches = (events['kind'] == _EVENT_CODES[event_type]) & (events['team'] == _TEAM_CODES[team_id])
+        return int(np.count_nonzero(matches))
+    
     def _detect_events(self, snapshot: MicroMomentumSnapshot):
         """Detect significant momentum moments within the snapshot."""
         
+        timestamp = snapshot.timestamp
+        momentum_a = snapshot.team_a_momentum_score
+        player_id = snapshot.on_ball_player_id or 'unknown'
+        append_event = self._record_event
+        
         # Create event if at peak
-        if snapshot.team_a_momentum_score > self.MOMENTUM_PEAK_THRESHOLD:
-            self.events.append(MicroMomentumEvent(
+        if momentum_a > self.MOMENTUM_PEAK_THRESHOLD:
+            append_event(MicroMomentumEvent(
                 event_type='momentum_peak',
-                timestamp=snapshot.timestamp,
-                player_id=snapshot.on_ball_player_id or 'unknown',
+                timestamp=timestamp,
+                player_id=player_id,
                 team_id='A',
-                magnitude=snapshot.team_a_momentum_score,
+                magnitude=momentum_a,
                 trigger=snapshot.game_state,
-                impact=min(100, snapshot.team_a_momentum_score - 50),
+                impact=min(100, momentum_a - 50),
             ))
-        elif snapshot.team_a_momentum_score < self.MOMENTUM_TROUGH_THRESHOLD:
-            self.events.append(MicroMomentumEvent(
+        elif momentum_a < self.MOMENTUM_TROUGH_THRESHOLD:
+            append_event(MicroMomentumEvent(
                 event_type='momentum_trough',
-                timestamp=snapshot.timestamp,
-                player_id=snapshot.on_ball_player_id or 'unknown',
+                timestamp=timestamp,
+                player_id=player_id,
                 team_id='A',
-                magnitude=snapshot.team_a_momentum_score,
+                magnitude=momentum_a,
                 trigger=snapshot.game_state,
-                impact=-(50 - snapshot.team_a_momentum_score),
+                impact=-(50 - momentum_a),
             ))
         
         # Detect inflection points (rapid momentum shifts)
         if len(self.snapshots) >= 2:
-            prev_snapshot = self.snapshots[-2]
-            momentum_change_a = snapshot.team_a_momentum_score - prev_snapshot.team_a_momentum_score
+            momentum_change_a = momentum_a - self.snapshots[-2].team_a_momentum_score
             momentum_change_rate = abs(momentum_change_a / snapshot.window_duration)
             
             if momentum_change_rate > self.INFLECTION_CHANGE_RATE:
-                self.events.append(MicroMomentumEvent(
+                append_event(MicroMomentumEvent(
                     event_type='inflection',
-                    timestamp=snapshot.timestamp,
-                    player_id=snapshot.on_ball_player_id or 'unknown',
+                    timestamp=timestamp,
+                    player_id=player_id,
                     team_id='A' if momentum_change_a > 0 else 'B',
                     magnitude=abs(momentum_change_a),
                     trigger='rapid_shift',
@@ -157,22 +257,22 @@ class MicroMomentumEngine:
         
         # Detect transition bursts
         if snapshot.game_state == 'transition':
-            self.events.append(MicroMomentumEvent(
+            append_event(MicroMomentumEvent(
                 event_type='burst',
-                timestamp=snapshot.timestamp,
-                player_id=snapshot.on_ball_player_id or 'unknown',
+                timestamp=timestamp,
+                player_id=player_id,
                 team_id='A',
-                magnitude=snapshot.team_a_momentum_score,
+                magnitude=momentum_a,
                 trigger='counter_attack',
                 impact=20.0,
             ))
         
         # Detect defensive collapses
         if snapshot.team_a_pressure < 15.0:  # Very close pressure = danger
-            self.events.append(MicroMomentumEvent(
+            append_event(MicroMomentumEvent(
                 event_type='collapse',
-                timestamp=snapshot.timestamp,
-                player_id=snapshot.on_ball_player_id or 'unknown',
+                timestamp=timestamp,
+                player_id=player_id,
                 team_id='A',
                 magnitude=50.0,
                 trigger='defensive_vulnerability',
@@ -195,24 +295,25 @@ class MicroMomentumEngine:
         if team_id not in ['A', 'B']:
             return []
         
-        team_key = f'team_{team_id.lower()}_momentum_score'
-        momentum_values = [getattr(s, team_key) for s in self.snapshots]
+        momentum_values = self._column(f'mom_{team_id.lower()}')
+        n = len(momentum_values)
         
-        if not momentum_values:
+        if not n:
             return []
         
-        # Rolling average for smooth curve
-        smoothed = []
-        window = window_size // 10  # Assuming 10-second snapshots
-        
-        for i in range(len(momentum_values)):
-            start = max(0, i - window)
-            end = min(len(momentum_values), i + window)
-            avg = statistics.mean(momentum_values[start:end])
-            timestamp = self.snapshots[i].timestamp
-            smoothed.append((timestamp, round(avg, 2)))
-        
-        return smoothed
+        # Rolling average for smooth curve over snapshots [i - window, i + window),
+        # read off a prefix sum. Windows under 10s average the snapshot alone.
+        window = max(0, window_size // 10)  # Assuming 10-second snapshots
+        prefix = np.concatenate(([0.0], np.cumsum(momentum_values)))
+        idx = np.arange(n)
+        starts = np.maximum(0, idx - window)
+        ends = np.minimum(n, idx + max(window, 1))
+        averages = (prefix[ends] - prefix[starts]) / (ends - starts)
+        
+        return [
+            (timestamp, round(avg, 2))
+            for timestamp, avg in zip(self._column('ts').tolist(), averages.tolist())
+        ]
     
     def find_inflection_points(self, team_id: str) -> List[int]:
         """
@@ -222,21 +323,12 @@ class MicroMomentumEngine:
             List of timestamps (seconds) where inflections occurred
         """
         
-        inflections = []
+        slope = np.sign(np.diff(self._column(f'mom_{team_id.lower()}')))
         
-        team_key = f'team_{team_id.lower()}_momentum_score'
-        momentum_values = [getattr(s, team_key) for s in self.snapshots]
+        # Peak or trough: the slope flips sign across the snapshot
+        turning = np.flatnonzero(slope[:-1] * slope[1:] < 0) + 1
         
-        for i in range(1, len(momentum_values) - 1):
-            prev = momentum_values[i - 1]
-            curr = momentum_values[i]
-            next_val = momentum_values[i + 1]
-            
-            # Peak or trough
-            if (curr > prev and curr > next_val) or (curr < prev and curr < next_val):
-                inflections.append(self.snapshots[i].timestamp)
-        
-        return inflections
+        return self._column('ts')[turning].tolist()
     
     def analyze_transition_bursts(self) -> List[Dict]:
         """
@@ -246,21 +338,20 @@ class MicroMomentumEngine:
             List of burst analysis dicts with timing, momentum gain, etc.
         """
         
-        bursts = []
-        
-        for event in self.events:
-            if event.event_type == 'burst':
-                burst_analysis = {
-                    'timestamp': event.timestamp,
-                    'team': event.team_id,
-                    'magnitude': event.magnitude,
-                    'momentum_gain': event.impact,
-                    'game_minute': event.timestamp // 60,
-                    'is_consequential': event.is_game_changing,
-                }
-                bursts.append(burst_analysis)
-        
-        return bursts
+        events = self._recorded_events()
+        bursts = events[events['kind'] == _EVENT_CODES['burst']]
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'team': TEAM_IDS[team],
+                'magnitude': magnitude,
+                'momentum_gain': impact,
+                'game_minute': timestamp // 60,
+                'is_consequential': is_game_changing,
+            }
+            for timestamp, _, team, magnitude, impact, is_game_changing in bursts.tolist()
+        ]
     
     def analyze_defensive_recovery_time(self, team_id: str, position: str = 'MID') -> float:
         """
@@ -271,24 +362,23 @@ class MicroMomentumEngine:
             Average recovery time in seconds
         """
         
-        recovery_times = []
-        position_key = f'team_{team_id.lower()}_pressure'
+        pressures = self._column(f'press_{team_id.lower()}')
+        timestamps = self._column('ts')
         
-        in_danger = False
-        danger_start = None
+        # Danger starts on a pressure spike and only ends once pressure is back
+        # at baseline, so keep the snapshots that hit either threshold and find
+        # where the signal flips between the two.
+        signal = np.where(pressures < self.PRESSURE_SPIKE_THRESHOLD, 1,
+                          np.where(pressures >= self.PRESSURE_RECOVERY_BASELINE, -1, 0))
+        marked = np.flatnonzero(signal)
+        signal = signal[marked]
+        previous = np.concatenate(([-1], signal[:-1]))
         
-        for snapshot in self.snapshots:
-            pressure = getattr(snapshot, position_key)
-            
-            if pressure < self.PRESSURE_SPIKE_THRESHOLD and not in_danger:
-                in_danger = True
-                danger_start = snapshot.timestamp
-            elif pressure >= self.PRESSURE_RECOVERY_BASELINE and in_danger:
-                recovery_time = snapshot.timestamp - danger_start
-                recovery_times.append(recovery_time)
-                in_danger = False
-        
-        return round(statistics.mean(recovery_times), 1) if recovery_times else 0.0
+        danger_starts = timestamps[marked[(signal == 1) & (previous != 1)]]
+        recoveries = timestamps[marked[(signal == -1) & (previous == 1)]]
+        recovery_times = recoveries - danger_starts[:len(recoveries)]
+        
+        return round(float(recovery_times.mean()), 1) if len(recovery_times) else 0.0
     
     def get_high_pressure_windows(self, team_id: str, threshold: float = 10.0) -> List[Tuple[int, int]]:
         """
@@ -302,59 +392,87 @@ class MicroMomentumEngine:
             List of (start_timestamp, end_timestamp) tuples
         """
         
-        position_key = f'team_{team_id.lower()}_pressure'
-        windows = []
-        in_window = False
-        window_start = None
+        timestamps = self._column('ts')
         
-        for snapshot in self.snapshots:
-            pressure = getattr(snapshot, position_key)
-            
-            if pressure < threshold and not in_window:
-                in_window = True
-                window_start = snapshot.timestamp
-            elif pressure >= threshold and in_window:
-                windows.append((window_start, snapshot.timestamp))
-                in_window = False
-        
-        # Close any open window
-        if in_window and self.snapshots:
-            windows.append((window_start, self.snapshots[-1].timestamp))
-        
-        return windows
+        if not len(timestamps):
+            return []
+        
+        # Pad with False so every window has a rising and a falling edge
+        under_pressure = self._column(f'press_{team_id.lower()}') < threshold
+        edges = np.diff(np.concatenate(([False], under_pressure, [False])).view(np.int8))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        
+        # A window still open at the last snapshot closes there
+        ends = np.minimum(ends, len(timestamps) - 1)
+        
+        return list(zip(timestamps[starts].tolist(), timestamps[ends].tolist()))
     
     def get_momentum_shift_summary(self) -> Dict:
         """
         Generate summary of momentum dynamics throughout match.
         """
         
-        team_a_values = [getattr(s, 'team_a_momentum_score') for s in self.snapshots]
-        team_b_values = [getattr(s, 'team_b_momentum_score') for s in self.snapshots]
+        team_a_values = self._column('mom_a')
+        team_b_values = self._column('mom_b')
         
         summary = {
             'team_a': {
-                'peak_momentum': max(team_a_values) if team_a_values else 0,
-                'lowest_momentum': min(team_a_values) if team_a_values else 0,
-                'average_momentum': round(statistics.mean(team_a_values), 1) if team_a_values else 0,
-                'momentum_variance': round(statistics.variance(team_a_values), 1) if len(team_a_values) > 1 else 0,
-                'inflection_points': len([e for e in self.events if e.team_id == 'A' and e.event_type == 'inflection']),
-                'momentum_peaks': len([e for e in self.events if e.team_id == 'A' and e.event_type == 'momentum_peak']),
+                'peak_momentum': float(team_a_values.max()) if len(team_a_values) else 0,
+                'lowest_momentum': float(team_a_values.min()) if len(team_a_values) else 0,
+                'average_momentum': round(float(team_a_values.mean()), 1) if len(team_a_values) else 0,
+                'momentum_variance': round(float(team_a_values.var(ddof=1)), 1) if len(team_a_values) > 1 else 0,
+                'inflection_points': self._count_events('inflection', 'A'),
+                'momentum_peaks': self._count_events('momentum_peak', 'A'),
             },
             'team_b': {
-                'peak_momentum': max(team_b_values) if team_b_values else 0,
-                'lowest_momentum': min(team_b_values) if team_b_values else 0,
-                'average_momentum': round(statistics.mean(team_b_values), 1) if team_b_values else 0,
-                'momentum_variance': round(statistics.variance(team_b_values), 1) if len(team_b_values) > 1 else 0,
-                'inflection_points': len([e for e in self.events if e.team_id == 'B' and e.event_type == 'inflection']),
-                'momentum_peaks': len([e for e in self.events if e.team_id == 'B' and e.event_type == 'momentum_peak']),
+                'peak_momentum': float(team_b_values.max()) if len(team_b_values) else 0,
+                'lowest_momentum': float(team_b_values.min()) if len(team_b_values) else 0,
+                'average_momentum': round(float(team_b_values.mean()), 1) if len(team_b_values) else 0,
+                'momentum_variance': round(float(team_b_values.var(ddof=1)), 1) if len(team_b_values) > 1 else 0,
+                'inflection_points': self._count_events('inflection', 'B'),
+                'momentum_peaks': self._count_events('momentum_peak', 'B'),
             },
             'total_moments': len(self.snapshots),
-            'total_events': len(self.events),
-            'game_changing_events': len([e for e in self.events if e.is_game_changing]),
+            'total_events': len(self._recorded_events()),
+            'game_changing_events': int(np.count_nonzero(self._recorded_events()['is_game_changing'])),
         }
         
         return summary
     
+    def export_micro_momentum_columns(self) -> Dict[str, object]:
+        """
+        Export the micro-momentum timeline column-wise.
+        
+        Same fields as export_micro_momentum_timeline, one array per field
+        (string fields are lists). Numeric columns are read-only views on the
+        column store, so they serialize directly with orjson's
+        OPT_SERIALIZE_NUMPY or load into a DataFrame without per-row dicts.
+        """
+        
+        def frozen(values: np.ndarray) -> np.ndarray:
+            view = values.view()
+            view.flags.writeable = False
+            return view
+        
+        timestamps = self._column('ts')
+        possession = self._column('possession')
+        
+        return {
+            'timestamp': frozen(timestamps),
+            'minute': timestamps // 60,
+            'second': timestamps % 60,
+            'team_a_momentum': frozen(self._column('mom_a')),
+            'team_b_momentum': frozen(self._column('mom_b')),
+            'momentum_shift_rate': frozen(self._column('shift_rate')),
+            'possession_a': frozen(possession),
+            'possession_b': 100 - possession,
+            'pressure_a': frozen(self._column('press_a')),
+            'pressure_b': frozen(self._column('press_b')),
+            'game_state': [snapshot.game_state for snapshot in self.snapshots],
+            'tactical_phase': [snapshot.tactical_phase for snapshot in self.snapshots],
+        }
+    
     def export_micro_momentum_timeline(self) -> List[Dict]:
         """
         Export complete micro-momentum timeline for visualization.
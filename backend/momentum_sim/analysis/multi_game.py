@@ -4,7 +4,7 @@ Multi-match aggregation and tactical pattern recognition
 """
 
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -24,6 +24,50 @@ class MultiGameAnalyzer:
         self.player_pmu_stats = {}
         self.team_metrics = {}
 
+        # Per-player/team/zone indexes, built once so each aggregation is a
+        # lookup instead of a scan over every match
+        self._player_appearances: List[Tuple[str, Optional[str], Optional[str]]] = []
+        self._player_pmu: Dict[str, List[Tuple[Optional[str], np.ndarray]]] = (
+            defaultdict(list)
+        )
+        self._team_momentum: Dict[str, List[np.ndarray]] = defaultdict(list)
+        self._team_coherence: Dict[str, List[float]] = defaultdict(list)
+        self._zone_moments: Dict[str, List[float]] = {
+            "defensive_third": [],
+            "middle_third": [],
+            "attacking_third": [],
+        }
+        for match in matches:
+            self._index_match(match)
+
+    def add_match(self, match: Dict) -> None:
+        """Add a match to the analysis set and its indexes"""
+        self.matches.append(match)
+        self._index_match(match)
+
+    def _index_match(self, match: Dict) -> None:
+        """Record a match's player, team and zone data in the indexes"""
+        for p in match.get("players") or ():
+            position = p.get("position")
+            # (id, name, position) in match order, for detect_undervalued_players
+            self._player_appearances.append((p["id"], p.get("name"), position))
+            if "pmu_history" in p:
+                self._player_pmu[p["id"]].append(
+                    (position, np.asarray(p["pmu_history"]))
+                )
+
+        for team in match.get("teams") or ():
+            if "momentum_history" in team:
+                self._team_momentum[team["id"]].append(
+                    np.asarray(team["momentum_history"])
+                )
+            if "formation_coherence" in team:
+                self._team_coherence[team["id"]].append(team["formation_coherence"])
+
+        for zone, moments in (match.get("zone_moments") or {}).items():
+            if moments:
+                self._zone_moments.setdefault(zone, []).extend(moments)
+
     def aggregate_player_momentum(self, player_id: str, position: str = None) -> Dict:
         """
         Aggregate PMU across all matches for a player
@@ -31,22 +75,16 @@ class MultiGameAnalyzer:
         Returns:
             stats: {'mean': float, 'std': float, 'max': float, 'consistency': float}
         """
-        pmuls = []
-
-        for match in self.matches:
-            if "players" in match:
-                for p in match["players"]:
-                    if p["id"] == player_id and (
-                        position is None or p["position"] == position
-                    ):
-                        if "pmu_history" in p:
-                            pmuls.extend(p["pmu_history"])
-
-        if not pmuls:
+        histories = [
+            history
+            for history_position, history in self._player_pmu.get(player_id, ())
+            if position is None or history_position == position
+        ]
+        pmuls = np.concatenate(histories) if histories else np.array([])
+
+        if not pmuls.size:
             return None
 
-        pmuls = np.array(pmuls)
-
         return {
             "player_id": player_id,
             "mean": float(np.mean(pmuls)),
@@ -64,22 +102,13 @@ class MultiGameAnalyzer:
         """
         Aggregate team momentum metrics across matches
         """
-        team_momentums = []
-        formation_coherences = []
-
-        for match in self.matches:
-            if "teams" in match:
-                for team in match["teams"]:
-                    if team["id"] == team_id:
-                        if "momentum_history" in team:
-                            team_momentums.extend(team["momentum_history"])
-                        if "formation_coherence" in team:
-                            formation_coherences.append(team["formation_coherence"])
-
-        if not team_momentums:
+        histories = self._team_momentum.get(team_id)
+        team_momentums = np.concatenate(histories) if histories else np.array([])
+        formation_coherences = self._team_coherence.get(team_id)
+
+        if not team_momentums.size:
             return None
 
-        team_momentums = np.array(team_momentums)
         formation_coherences = (
             np.array(formation_coherences) if formation_coherences else np.array([0.8])
         )
@@ -103,20 +132,8 @@ class MultiGameAnalyzer:
         Returns:
             zone_stats: {'defensive_third': {...}, 'middle_third': {...}, 'attacking_third': {...}}
         """
-        zone_momentums = {
-            "defensive_third": [],
-            "middle_third": [],
-            "attacking_third": [],
-        }
-
-        for match in self.matches:
-            if "zone_moments" in match:
-                for zone, moments in match["zone_moments"].items():
-                    if moments:
-                        zone_momentums[zone].extend(moments)
-
         stats = {}
-        for zone, momentums in zone_momentums.items():
+        for zone, momentums in self._zone_moments.items():
             if momentums:
                 momentums = np.array(momentums)
                 stats[zone] = {
@@ -147,27 +164,24 @@ class MultiGameAnalyzer:
         Returns:
             players: Sorted by impact/value ratio
         """
-        players_data = defaultdict(list)
-
-        for match in self.matches:
-            if "players" in match:
-                for p in match["players"]:
-                    if position is None or p.get("position") == position:
-                        players_data[p["id"]].append(
-                            {
-                                "name": p.get("name"),
-                                "position": p.get("position"),
-                                "pmu_stats": self.aggregate_player_momentum(
-                                    p["id"], position
-                                ),
-                            }
-                        )
+        # First matching appearance of each player, aggregated once per player
+        players_data = {}
+
+        for pid, name, player_position in self._player_appearances:
+            if pid not in players_data and (
+                position is None or player_position == position
+            ):
+                players_data[pid] = {
+                    "name": name,
+                    "position": player_position,
+                    "pmu_stats": self.aggregate_player_momentum(pid, position),
+                }
 
         # Score players by consistency and peak momentum
         scored_players = []
         for pid, data in players_data.items():
-            if data[0]["pmu_stats"]:
-                stats = data[0]["pmu_stats"]
+            if data["pmu_stats"]:
+                stats = data["pmu_stats"]
 
                 # Impact score: mean * consistency
                 impact_score = stats["mean"] * (1 + stats["consistency"] * 0.5)
@@ -175,8 +189,8 @@ class MultiGameAnalyzer:
                 scored_players.append(
                     {
                         "player_id": pid,
-                        "name": data[0]["name"],
-                        "position": data[0]["position"],
+                        "name": data["name"],
+                        "position": data["position"],
                         "avg_pmu": stats["mean"],
                         "consistency": stats["consistency"],
                         "impact_score": impact_score,
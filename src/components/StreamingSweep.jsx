@@ -37,9 +37,10 @@ export default function StreamingSweep({ iterations }) {
       reconnectionDelay: 1000,
       reconnectionAttempts: 10,
     });
-    socketRef.current.on('sweep_progress', (data) => {
-      setProgress(data);
-      setProgressLog((prev) => [...prev.slice(-19), data]);
+    socketRef.current.on('sweep_progress_batch', (batch) => {
+      if (!batch.length) return;
+      setProgress(batch[batch.length - 1]);
+      setProgressLog((prev) => [...prev, ...batch].slice(-20));
     });
     socketRef.current.on('sweep_complete', (data) => {
       setSweepResults(data.result);
@@ -22,6 +22,7 @@ print("✓ CalibrationValidator instantiated")
 
 # Test predictor
 predictor = create_simple_xg_predictor()
+assert callable(predictor), "create_simple_xg_predictor must return the predictor"
 test_match = matches[0]
 predicted_xg = predictor(test_match)
 print(f"✓ Predictor works: predicted_xg={predicted_xg:.3f}")
@@ -0,0 +1,48 @@
+"""
+Quick test of the micro-momentum engine
+Run with: python test_micro_momentum.py
+"""
+
+import sys
+
+sys.path.insert(0, ".")
+
+from backend.momentum_sim.analysis.micro_momentum import (
+    MicroMomentumEngine,
+    MicroMomentumSnapshot,
+)
+
+
+def _snapshot(timestamp: int, momentum_a: float, momentum_b: float):
+    return MicroMomentumSnapshot(
+        timestamp=timestamp,
+        window_duration=10,
+        possession_percentage=55.0,
+        pass_completion=0.8,
+        team_a_pressure=18.0,
+        team_b_pressure=22.0,
+        progressive_passes_a=2,
+        progressive_passes_b=1,
+        tackles_a=1,
+        tackles_b=0,
+        interceptions_a=0,
+        interceptions_b=1,
+        team_a_momentum_score=momentum_a,
+        team_b_momentum_score=momentum_b,
+        momentum_shift_rate=0.1,
+    )
+
+
+def test_momentum_history_keyed_by_team():
+    """add_snapshot records each team's score under 'A'/'B'."""
+    engine = MicroMomentumEngine()
+    engine.add_snapshot(_snapshot(0, 62.0, 38.0))
+    engine.add_snapshot(_snapshot(10, 48.5, 51.5))
+
+    assert list(engine.momentum_history["A"]) == [62.0, 48.5]
+    assert list(engine.momentum_history["B"]) == [38.0, 51.5]
+    print("✓ momentum_history keyed by team → PASS")
+
+
+if __name__ == "__main__":
+    test_momentum_history_keyed_by_team()
@@ -9,6 +9,7 @@ sys.path.insert(0, ".")
 
 from backend.middleware.validation import (
     ValidationError,
+    _dedupe_tags_cached,
     validate_crowd_noise,
     validate_formation,
     validate_iterations,
@@ -127,6 +128,18 @@ def test_validators():
     except ValidationError as e:
         print(f"✗ Duplicate tags test failed: {e}")
 
+    # Test 15: Long tag lists are rejected or validated without being cached
+    cached = _dedupe_tags_cached.cache_info().currsize
+    try:
+        validate_tags(["x"] * 10_000)
+    except ValidationError:
+        print("✓ Long duplicate tag list rejected → PASS")
+    else:
+        raise AssertionError("Long duplicate tag list should have failed")
+    assert validate_tags([" "] * 10_000 + ["x"]) == ["x"]
+    assert _dedupe_tags_cached.cache_info().currsize == cached
+    print("✓ Long tag lists bypass the tag cache → PASS")
+
     print("\n" + "=" * 50)
     print("All validation tests completed!")
 